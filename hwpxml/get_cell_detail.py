@@ -13,6 +13,12 @@ from pathlib import Path
 from io import BytesIO
 
 
+def _tag(elem) -> str:
+    """요소 태그 문자열 (lxml 주석/PI 노드는 태그가 문자열이 아니므로 빈 문자열)"""
+    tag = elem.tag
+    return tag if isinstance(tag, str) else ''
+
+
 @dataclass
 class FontInfo:
     """폰트 정보"""
@@ -227,6 +233,20 @@ class GetCellDetail:
 
         return tables_cells
 
+    def load_header(self, hwpx_path: Union[str, Path]):
+        """header.xml 스타일 정의만 로드 (parse_table 호출 전 1회)"""
+        self._clear_caches()
+        with zipfile.ZipFile(Path(hwpx_path), 'r') as zf:
+            if 'Contents/header.xml' in zf.namelist():
+                self._parse_header(zf.read('Contents/header.xml'))
+
+    def parse_table(self, tbl_element) -> List[CellDetail]:
+        """이미 파싱된 tbl 요소에서 직접 셀 정보 추출 (중첩 테이블 제외)
+
+        호출 측이 section XML을 직접 순회/수정하면서 셀 정보가 필요할 때 사용
+        """
+        return self._parse_table_direct_cells(tbl_element, tbl_element.get('id', ''))
+
     def _parse_section_by_table(self, xml_content: bytes) -> List[List[CellDetail]]:
         """section XML에서 테이블별로 셀 정보 파싱 (중첩 테이블 순서 유지)"""
         tables_cells = []
@@ -240,7 +260,7 @@ class GetCellDetail:
     def _find_tables_recursive(self, element, tables_cells: List[List[CellDetail]]):
         """재귀적으로 테이블을 찾아 순서대로 처리"""
         for child in element:
-            if child.tag.endswith('}tbl'):
+            if _tag(child).endswith('}tbl'):
                 # 테이블 ID 추출
                 table_id = child.get('id', '')
 
@@ -250,10 +270,10 @@ class GetCellDetail:
 
                 # 셀 내부의 중첩 테이블 재귀 탐색
                 for tr in child:
-                    if not tr.tag.endswith('}tr'):
+                    if not _tag(tr).endswith('}tr'):
                         continue
                     for tc in tr:
-                        if not tc.tag.endswith('}tc'):
+                        if not _tag(tc).endswith('}tc'):
                             continue
                         # 셀 내부에서 중첩 테이블 찾기
                         self._find_tables_recursive(tc, tables_cells)
@@ -266,10 +286,10 @@ class GetCellDetail:
         cells = []
 
         for tr in tbl_element:
-            if not tr.tag.endswith('}tr'):
+            if not _tag(tr).endswith('}tr'):
                 continue
             for tc in tr:
-                if not tc.tag.endswith('}tc'):
+                if not _tag(tc).endswith('}tc'):
                     continue
 
                 cell = CellDetail()
@@ -289,7 +309,7 @@ class GetCellDetail:
 
                 # 셀 내부 요소 파싱
                 for child in tc:
-                    tag = child.tag.split('}')[-1]
+                    tag = _tag(child).split('}')[-1]
 
                     if tag == 'subList':
                         cell.list_id = child.get('id', '')
@@ -326,9 +346,9 @@ class GetCellDetail:
 
         # 폰트 정의 파싱 (HANGUL fontface만)
         for fontface in root.iter():
-            if fontface.tag.endswith('}fontface') and fontface.get('lang') == 'HANGUL':
+            if _tag(fontface).endswith('}fontface') and fontface.get('lang') == 'HANGUL':
                 for font in fontface:
-                    if font.tag.endswith('}font'):
+                    if _tag(font).endswith('}font'):
                         font_id = font.get('id', '')
                         face = font.get('face', '')
                         if font_id:
@@ -337,7 +357,7 @@ class GetCellDetail:
 
         # 문자 속성 파싱
         for elem in root.iter():
-            if elem.tag.endswith('}charPr'):
+            if _tag(elem).endswith('}charPr'):
                 char_id = elem.get('id', '')
                 if char_id:
                     self._char_props[char_id] = {
@@ -350,13 +370,13 @@ class GetCellDetail:
                     }
                     # 폰트 참조 찾기
                     for child in elem:
-                        if child.tag.endswith('}fontRef'):
+                        if _tag(child).endswith('}fontRef'):
                             hangul_ref = child.get('hangul', '0')
                             self._char_props[char_id]['font_ref'] = hangul_ref
 
         # 문단 속성 파싱
         for elem in root.iter():
-            if elem.tag.endswith('}paraPr'):
+            if _tag(elem).endswith('}paraPr'):
                 para_id = elem.get('id', '')
                 if para_id:
                     self._para_props[para_id] = {
@@ -365,15 +385,15 @@ class GetCellDetail:
                         'line_spacing': 160,
                     }
                     for child in elem:
-                        if child.tag.endswith('}align'):
+                        if _tag(child).endswith('}align'):
                             self._para_props[para_id]['align_h'] = child.get('horizontal', 'LEFT')
                             self._para_props[para_id]['align_v'] = child.get('vertical', 'BASELINE')
-                        elif child.tag.endswith('}lineSpacing'):
+                        elif _tag(child).endswith('}lineSpacing'):
                             self._para_props[para_id]['line_spacing'] = int(child.get('value', 160))
 
         # 테두리/배경 파싱
         for elem in root.iter():
-            if elem.tag.endswith('}borderFill'):
+            if _tag(elem).endswith('}borderFill'):
                 bf_id = elem.get('id', '')
                 if bf_id:
                     self._border_fills[bf_id] = {
@@ -384,17 +404,17 @@ class GetCellDetail:
                         'bg_color': '',
                     }
                     for child in elem:
-                        if child.tag.endswith('}leftBorder'):
+                        if _tag(child).endswith('}leftBorder'):
                             self._border_fills[bf_id]['left'] = child.get('type', 'NONE')
-                        elif child.tag.endswith('}rightBorder'):
+                        elif _tag(child).endswith('}rightBorder'):
                             self._border_fills[bf_id]['right'] = child.get('type', 'NONE')
-                        elif child.tag.endswith('}topBorder'):
+                        elif _tag(child).endswith('}topBorder'):
                             self._border_fills[bf_id]['top'] = child.get('type', 'NONE')
-                        elif child.tag.endswith('}bottomBorder'):
+                        elif _tag(child).endswith('}bottomBorder'):
                             self._border_fills[bf_id]['bottom'] = child.get('type', 'NONE')
-                        elif child.tag.endswith('}fillBrush'):
+                        elif _tag(child).endswith('}fillBrush'):
                             for brush_child in child:
-                                if brush_child.tag.endswith('}winBrush'):
+                                if _tag(brush_child).endswith('}winBrush'):
                                     self._border_fills[bf_id]['bg_color'] = brush_child.get('faceColor', '')
 
     def _parse_section(self, xml_content: bytes) -> List[CellDetail]:
@@ -404,7 +424,7 @@ class GetCellDetail:
 
         # 테이블 내 셀 찾기
         for tc_elem in root.iter():
-            if not tc_elem.tag.endswith('}tc'):
+            if not _tag(tc_elem).endswith('}tc'):
                 continue
 
             cell = CellDetail()
@@ -423,7 +443,7 @@ class GetCellDetail:
 
             # 셀 내부 요소 파싱
             for child in tc_elem:
-                tag = child.tag.split('}')[-1]
+                tag = _tag(child).split('}')[-1]
 
                 if tag == 'subList':
                     cell.list_id = child.get('id', '')
@@ -459,7 +479,7 @@ class GetCellDetail:
         all_texts = []
 
         for p_elem in sublist_elem:
-            if not p_elem.tag.endswith('}p'):
+            if not _tag(p_elem).endswith('}p'):
                 continue
 
             para_info = ParaInfo()
@@ -481,7 +501,7 @@ class GetCellDetail:
 
             # run 요소에서 텍스트와 문자 속성 추출
             for child in p_elem:
-                tag = child.tag.split('}')[-1]
+                tag = _tag(child).split('}')[-1]
 
                 if tag == 'run':
                     char_pr_id = child.get('charPrIDRef', '')
@@ -523,12 +543,12 @@ class GetCellDetail:
 
                     # 텍스트 추출
                     for t_elem in child:
-                        if t_elem.tag.endswith('}t') and t_elem.text:
+                        if _tag(t_elem).endswith('}t') and t_elem.text:
                             para_texts.append(t_elem.text)
 
                 elif tag == 'linesegarray':
                     # lineseg에서 줄 수와 높이 추출
-                    linesegs = [ls for ls in child if ls.tag.endswith('}lineseg')]
+                    linesegs = [ls for ls in child if _tag(ls).endswith('}lineseg')]
                     para_info.line_count = len(linesegs) if linesegs else 1
 
                     if linesegs:
@@ -543,7 +563,7 @@ class GetCellDetail:
                 elif tag == 'ctrl':
                     # ctrl 내에 테이블이 있는지 확인
                     for ctrl_child in child:
-                        if ctrl_child.tag.endswith('}tbl'):
+                        if _tag(ctrl_child).endswith('}tbl'):
                             para_info.has_nested_table = True
                             break
 
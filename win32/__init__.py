@@ -4,6 +4,9 @@ win32 모듈 - 한글 COM API 연동
 
 Windows 환경에서 한글 프로그램과 COM API를 통해 상호작용
 (Windows 전용)
+
+get_tables_from_file은 파일별로 결과를 캐시하므로 반환되는 TableProperty의 ctrl은 None
+(컨트롤이 필요하면 GetTableProperty 직접 사용)
 """
 
 # Windows 환경에서만 import 가능
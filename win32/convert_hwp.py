@@ -7,11 +7,20 @@ Windows 환경에서만 실행 가능합니다.
 """
 
 import os
+import shutil
 import sys
+import time
+import atexit
+import functools
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import List, Optional
 
 try:
+    import pythoncom
     import win32com.client as win32
     from pywintypes import com_error
 except ImportError:
@@ -19,9 +28,151 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from hwp_file_manager import get_or_create_hwp, open_hwp
+    from hwp_file_manager import get_or_create_hwp, create_hwp_instance, open_hwp, is_hwp_alive
 except ImportError:
-    from win32.hwp_file_manager import get_or_create_hwp, open_hwp
+    from win32.hwp_file_manager import get_or_create_hwp, create_hwp_instance, open_hwp, is_hwp_alive
+
+
+# RPC_E_CALL_REJECTED: 한글이 바쁠 때(다른 호출 처리 중) COM 호출 거부
+RPC_E_CALL_REJECTED = -2147418111
+
+# 병렬 변환 시 워커 기동 간격 (처음 max_workers개 제출만, 한글 동시 기동 충돌 완화, 초)
+_SUBMIT_INTERVAL = 0.2
+
+
+def _retry_on_call_rejected(retries: int = 5, delay: float = 0.5):
+    """RPC_E_CALL_REJECTED 발생 시 잠시 대기 후 재시도하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(retries):
+                try:
+                    return func(*args, **kwargs)
+                except com_error as e:
+                    if e.hresult != RPC_E_CALL_REJECTED or attempt == retries - 1:
+                        raise
+                    time.sleep(delay * (attempt + 1))
+        return wrapper
+    return decorator
+
+
+class _HwpPool:
+    """
+    한글 COM 인스턴스 풀
+
+    한글 실행(Dispatch + 보안 모듈 등록)은 파일 변환보다 훨씬 비싸므로
+    프로세스당 하나의 인스턴스를 만들어 여러 변환에 재사용합니다.
+    반환 시에는 문서만 닫고(Clear), 직접 생성한 인스턴스는 인터프리터 종료 시 1회 Quit 합니다.
+    """
+
+    def __init__(self, attach_existing: bool = True):
+        """
+        Args:
+            attach_existing: True면 열린 한글에 연결 (없으면 생성),
+                             False면 항상 새 한글 생성 (병렬 워커용)
+        """
+        self._hwp = None
+        self._is_new = False
+        self._attach_existing = attach_existing
+        self._lock = threading.RLock()
+        # shutdown은 인스턴스를 처음 만들 때 1회만 atexit 등록 (재생성 때마다 쌓이지 않도록)
+        self._atexit_registered = False
+        # 저장용 COM 핸들 캐시 (HAction, HFileOpenSave)
+        self._action = None
+        self._file_pset = None
+        self._scratch = None
+
+    @property
+    def scratch(self) -> Path:
+        """
+        풀 전용 임시 폴더 (최초 접근 시 1회 생성, 인터프리터 종료 시 삭제)
+
+        임시 HWPX는 이 폴더 안의 고정 파일명에 덮어써서 재사용합니다.
+        """
+        with self._lock:
+            if self._scratch is None:
+                self._scratch = Path(tempfile.mkdtemp(prefix="hwpconv_"))
+                atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
+            return self._scratch
+
+    def get(self):
+        """풀의 한글 인스턴스 반환 (없거나 한글이 종료되었으면 새로 연결/생성)"""
+        with self._lock:
+            if self._hwp is not None and not is_hwp_alive(self._hwp):
+                # 사용자가 한글을 닫는 등 캐시된 인스턴스가 죽은 경우
+                self._hwp = None
+                self._is_new = False
+                self._action = None
+                self._file_pset = None
+            if self._hwp is None:
+                if self._attach_existing:
+                    self._hwp, self._is_new = get_or_create_hwp(visible=False)
+                else:
+                    self._hwp, self._is_new = create_hwp_instance(visible=False), True
+                if self._is_new and not self._atexit_registered:
+                    atexit.register(self.shutdown)
+                    self._atexit_registered = True
+                self._action = self._hwp.HAction
+                self._file_pset = self._hwp.HParameterSet.HFileOpenSave
+            return self._hwp
+
+    def save_as(self, filepath: str, format_type: str):
+        """
+        풀의 한글 문서를 다른 이름/형식으로 저장
+
+        HFileOpenSave는 FileOpen과 공유되므로 GetDefault는 매번 호출하되,
+        HAction/HParameterSet 체인 조회는 캐시한 핸들로 대체
+        """
+        self.get()
+        pset = self._file_pset
+        self._action.GetDefault("FileSaveAs_S", pset.HSet)
+        pset.FileName = filepath
+        pset.Format = format_type
+        self._action.Execute("FileSaveAs_S", pset.HSet)
+
+    @contextmanager
+    def acquire(self):
+        """
+        한글 인스턴스 대여
+
+        with hwp_pool.acquire() as hwp:
+            ...
+        블록 종료 시 열린 문서를 저장 없이 닫습니다 (Quit 하지 않음).
+        """
+        with self._lock:
+            hwp = self.get()
+            try:
+                yield hwp
+            finally:
+                try:
+                    hwp.Clear(1)
+                except com_error:
+                    pass
+
+    def shutdown(self):
+        """직접 생성한 한글 인스턴스 종료 (기존에 열려 있던 한글은 유지)"""
+        with self._lock:
+            if self._hwp is not None and self._is_new:
+                try:
+                    self._hwp.Quit()
+                except com_error:
+                    pass
+            self._hwp = None
+            self._is_new = False
+            self._action = None
+            self._file_pset = None
+
+
+# 모듈 전역 풀 (convert_* 함수와 ExtractCellMeta가 공유)
+hwp_pool = _HwpPool()
+
+
+@_retry_on_call_rejected()
+def _open_and_save_as(src_path: str, src_format: str, dst_path: str, dst_format: str):
+    """풀의 한글로 파일을 열어 다른 형식으로 저장"""
+    with hwp_pool.acquire() as hwp:
+        open_hwp(hwp, src_path, src_format)
+        hwp_pool.save_as(dst_path, dst_format)
 
 
 def convert_hwp_to_hwpx(hwp_path: str, output_path: str = None) -> str:
@@ -44,28 +195,13 @@ def convert_hwp_to_hwpx(hwp_path: str, output_path: str = None) -> str:
     else:
         output_path = Path(output_path)
 
-    hwp, is_new = get_or_create_hwp(visible=False)
-
     try:
-        # 파일 열기
-        open_hwp(hwp, str(hwp_path), "HWP")
-
-        # HWPX로 저장
-        hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(output_path)
-        hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
-        hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-
-        # 문서 닫기
-        hwp.Clear(1)
-
+        # 풀의 한글로 열어서 HWPX로 저장 (문서는 자동으로 닫힘)
+        _open_and_save_as(str(hwp_path), "HWP", str(output_path), "HWPX")
         return str(output_path)
 
     except com_error as e:
         raise RuntimeError(f"변환 중 오류: {e}")
-    finally:
-        if is_new:
-            hwp.Quit()
 
 
 def convert_hwpx_to_hwp(hwpx_path: str, output_path: str = None) -> str:
@@ -88,25 +224,12 @@ def convert_hwpx_to_hwp(hwpx_path: str, output_path: str = None) -> str:
     else:
         output_path = Path(output_path)
 
-    hwp, is_new = get_or_create_hwp(visible=False)
-
     try:
-        open_hwp(hwp, str(hwpx_path), "HWPX")
-
-        hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(output_path)
-        hwp.HParameterSet.HFileOpenSave.Format = "HWP"
-        hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-
-        hwp.Clear(1)
-
+        _open_and_save_as(str(hwpx_path), "HWPX", str(output_path), "HWP")
         return str(output_path)
 
     except com_error as e:
         raise RuntimeError(f"변환 중 오류: {e}")
-    finally:
-        if is_new:
-            hwp.Quit()
 
 
 def convert_to_hwpx_temp(hwp_path: str) -> str:
@@ -120,28 +243,132 @@ def convert_to_hwpx_temp(hwp_path: str) -> str:
         임시 HWPX 파일 경로
     """
     hwp_path = Path(hwp_path)
-    temp_dir = tempfile.gettempdir()
-    output_path = Path(temp_dir) / f"{hwp_path.stem}_temp.hwpx"
+    output_path = hwp_pool.scratch / f"{hwp_path.stem}.hwpx"
 
     return convert_hwp_to_hwpx(str(hwp_path), str(output_path))
 
 
+def _init_worker():
+    """병렬 변환 워커 초기화: COM 초기화 + 워커 전용 한글 풀"""
+    global hwp_pool
+    pythoncom.CoInitialize()
+    # 워커끼리 같은 한글에 붙으면 직렬화되므로 항상 새 인스턴스 사용
+    hwp_pool = _HwpPool(attach_existing=False)
+
+
+def _output_paths(src_paths: List[str], out_dir: Optional[str], suffix: str) -> List[Optional[str]]:
+    """
+    convert_many의 파일별 출력 경로 (out_dir이 없으면 None = 입력 파일 옆)
+
+    다른 폴더의 같은 이름 파일이 out_dir에서 서로 덮어쓰지 않도록 _2, _3... 을 붙임
+    """
+    if not out_dir:
+        return [None] * len(src_paths)
+
+    used = set()  # Windows 파일명은 대소문자 구분 없음
+    paths = []
+    for src in src_paths:
+        stem = Path(src).stem
+        name = stem + suffix
+        n = 1
+        while name.lower() in used:
+            n += 1
+            name = f"{stem}_{n}{suffix}"
+        if n > 1:
+            print(f"출력 파일명 중복: {src} -> {name}")
+        used.add(name.lower())
+        paths.append(str(Path(out_dir) / name))
+    return paths
+
+
+def _worker_convert(src_path: str, output_path: Optional[str], to_hwp: bool) -> Optional[str]:
+    """워커 프로세스에서 파일 1개 변환 (실패 시 None)"""
+    try:
+        if to_hwp:
+            return convert_hwpx_to_hwp(src_path, output_path)
+        return convert_hwp_to_hwpx(src_path, output_path)
+    except Exception as e:
+        print(f"변환 실패: {src_path} ({e})")
+        return None
+
+
+def convert_many(
+    hwp_paths: List[str],
+    out_dir: str = None,
+    max_workers: int = None,
+    to_hwp: bool = False
+) -> List[Optional[str]]:
+    """
+    여러 파일을 프로세스 병렬로 변환
+
+    한글 COM은 단일 스레드 아파트라 스레드로는 직렬화되므로,
+    워커 프로세스마다 별도의 한글 인스턴스를 띄워 변환합니다.
+
+    Args:
+        hwp_paths: 입력 파일 경로 목록
+        out_dir: 출력 폴더 (None이면 입력 파일과 같은 위치, 같은 이름 파일은 _2, _3... 으로 구분)
+        max_workers: 워커 수 (None이면 CPU 수의 절반)
+        to_hwp: True면 HWPX → HWP, False면 HWP → HWPX
+
+    Returns:
+        입력 순서대로 변환된 파일 경로 목록 (실패한 항목은 None)
+    """
+    if not hwp_paths:
+        return []
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+    max_workers = min(max_workers, len(hwp_paths))
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    src_paths = [str(path) for path in hwp_paths]
+    output_paths = _output_paths(src_paths, out_dir, ".hwp" if to_hwp else ".hwpx")
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = []
+        for i, (src, output_path) in enumerate(zip(src_paths, output_paths)):
+            futures.append(executor.submit(_worker_convert, src, output_path, to_hwp))
+            # 워커(한글)가 새로 뜨는 처음 max_workers개만 간격을 둠 (이후는 기존 워커 재사용)
+            if i < max_workers - 1:
+                time.sleep(_SUBMIT_INTERVAL)
+        return [f.result() for f in futures]
+
+
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="HWP ↔ HWPX 변환")
-    parser.add_argument("input", help="입력 파일 경로")
-    parser.add_argument("-o", "--output", help="출력 파일 경로")
+    parser.add_argument("input", nargs="+", help="입력 파일 또는 폴더 경로")
+    parser.add_argument("-o", "--output", help="출력 파일 경로 (여러 파일이면 출력 폴더)")
     parser.add_argument("--to-hwp", action="store_true", help="HWPX → HWP 변환")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 변환 워커 수 (여러 파일일 때)")
 
     args = parser.parse_args()
 
+    # 폴더 입력은 대상 확장자 파일로 확장
+    src_ext = ".hwpx" if args.to_hwp else ".hwp"
+    inputs = []
+    for item in args.input:
+        if os.path.isdir(item):
+            inputs.extend(sorted(str(p) for p in Path(item).glob(f"*{src_ext}")))
+        else:
+            inputs.append(item)
+
     try:
-        if args.to_hwp:
-            result = convert_hwpx_to_hwp(args.input, args.output)
+        if len(inputs) == 1:
+            if args.to_hwp:
+                result = convert_hwpx_to_hwp(inputs[0], args.output)
+            else:
+                result = convert_hwp_to_hwpx(inputs[0], args.output)
+            print(f"변환 완료: {result}")
         else:
-            result = convert_hwp_to_hwpx(args.input, args.output)
-        print(f"변환 완료: {result}")
+            results = convert_many(inputs, args.output, args.workers, args.to_hwp)
+            done = [r for r in results if r]
+            print(f"변환 완료: {len(done)}/{len(inputs)}개")
+            if len(done) < len(inputs):
+                sys.exit(1)
     except Exception as e:
         print(f"오류: {e}")
         sys.exit(1)
@@ -8,12 +8,138 @@ HWP COM API + HWPX XML 결합
 
 import sys
 import os
-import json
-import tempfile
+import re
 import zipfile
-import xml.etree.ElementTree as ET
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from io import BytesIO
+from typing import Optional
+
+import yaml
+
+# 셀 field_name(JSON) 파싱: orjson(C) 있으면 사용
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
+# LibYAML(C) 덤퍼 우선 사용
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# lxml(libxml2) 사용 가능하면 우선 사용, 없으면 표준 ElementTree
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
+# HWPX 테이블 관련 태그 (tbl/tr/tc 등은 hp 네임스페이스)
+# 노드마다 endswith/split 하지 않고 완성된 태그 문자열과 바로 비교
+_HP = '{http://www.hancom.co.kr/hwpml/2011/paragraph}'
+TAG_TBL = sys.intern(_HP + 'tbl')
+TAG_TR = sys.intern(_HP + 'tr')
+TAG_TC = sys.intern(_HP + 'tc')
+TAG_CAPTION = sys.intern(_HP + 'caption')
+TAG_T = sys.intern(_HP + 't')
+TAG_CELL_ADDR = sys.intern(_HP + 'cellAddr')
+TAG_CELL_SPAN = sys.intern(_HP + 'cellSpan')
+
+
+class _MetaDumper(_Dumper):
+    """셀 메타 YAML 덤퍼 (정수 리스트는 한 줄 flow 스타일)"""
+
+
+def _represent_list(dumper, data):
+    # 셀 [tblIdx, row, col, rowSpan, colSpan, list_id], list_range 등은 [a, b, ...] 형식
+    flow = bool(data) and all(type(x) is int for x in data)
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=flow)
+
+
+_MetaDumper.add_representer(list, _represent_list)
+
+
+def _parse_field_name(field_name: str):
+    """셀 field_name(JSON) 파싱 (JSON 객체가 아니면 None)"""
+    if not field_name:
+        return None
+    try:
+        fd = _jloads(field_name)
+    except ValueError:
+        return None
+    return fd if isinstance(fd, dict) else None
+
+
+# insert_table_field가 쓰는 필드명 앞부분: {"tblIdx":N,"rowAddr":R,"colAddr":C,...}
+_ADDR_RE = re.compile(r'"tblIdx":\s*(\d+),\s*"rowAddr":\s*(\d+),\s*"colAddr":\s*(\d+)')
+
+
+def _field_addr(field_name: str):
+    """
+    셀 field_name에서 (tblIdx, rowAddr, colAddr)만 추출 (JSON 객체가 아니면 None)
+
+    정규식으로 바로 읽고, 키 순서가 다른 필드명만 JSON 파싱 (없는 tblIdx는 None)
+    """
+    if not field_name:
+        return None
+    m = _ADDR_RE.search(field_name)
+    if m:
+        return int(m[1]), int(m[2]), int(m[3])
+    fd = _parse_field_name(field_name)
+    if fd is None:
+        return None
+    return fd.get('tblIdx'), fd.get('rowAddr', 0), fd.get('colAddr', 0)
+
+
+def _cell_tbl_idx(cell: dict, default: int) -> int:
+    """셀 field_name의 tblIdx (없으면 default)"""
+    addr = _field_addr(cell['field_name'])
+    if addr and addr[0] is not None:
+        return addr[0]
+    return default
+
+
+def _field_data(cell: dict):
+    """셀의 field_name 파싱 결과 (읽을 때 파싱해 둔 값 재사용)"""
+    if 'field_parsed' not in cell:
+        cell['field_parsed'] = _parse_field_name(cell.get('field_name', ''))
+    return cell['field_parsed']
+
+
+def _read_cell_addr(sub, cell_data: dict):
+    cell_data['row'] = int(sub.get('rowAddr', 0))
+    cell_data['col'] = int(sub.get('colAddr', 0))
+
+
+def _read_cell_span(sub, cell_data: dict):
+    cell_data['row_span'] = int(sub.get('rowSpan', 1))
+    cell_data['col_span'] = int(sub.get('colSpan', 1))
+
+
+# tc 자식 태그 -> 처리 함수 (그 외 태그는 무시)
+_CELL_HANDLERS = {
+    TAG_CELL_ADDR: _read_cell_addr,
+    TAG_CELL_SPAN: _read_cell_span,
+}
+
+
+# 캡션 줄바꿈 -> 공백 (따옴표 등 YAML 이스케이프는 덤퍼가 처리)
+_CAPTION_TRANS = str.maketrans('\r\n', '  ')
+
+
+def _has_tables(hwpx_path: str) -> bool:
+    """HWPX section XML에 tbl 요소가 하나라도 있는지 (파싱 없이 바이트 검색)"""
+    with zipfile.ZipFile(hwpx_path, 'r') as zf:
+        for name in section_files(zf.namelist()):
+            data = zf.read(name)
+            if b':tbl ' in data or b':tbl>' in data or b'<tbl' in data:
+                return True
+    return False
+
 
 # 프로젝트 루트 경로 설정
 _project_root = Path(__file__).parent.parent
@@ -34,44 +160,31 @@ _win32_dir = Path(__file__).parent
 if str(_win32_dir) not in sys.path:
     sys.path.insert(0, str(_win32_dir))
 
-from cursor import get_hwp_instance
-from hwp_file_manager import open_hwp
-import win32com.client as win32
-
-
-def get_or_create_hwp():
-    """실행 중인 한글에 연결하거나, 없으면 새로 실행"""
-    hwp = get_hwp_instance()
-    if hwp:
-        try:
-            hwp.SetMessageBoxMode(0x7FFFFFFF)
-            hwp.RegisterModule("FilePathCheckerModuleExample", "FilePathCheckerModule")
-            hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
-        except:
-            pass
-        return hwp
-    hwp = win32.Dispatch("HWPFrame.HwpObject")
-    hwp.SetMessageBoxMode(0x7FFFFFFF)
-    hwp.RegisterModule("FilePathCheckerModuleExample", "FilePathCheckerModule")
-    hwp.RegisterModule("FilePathCheckDLL", "SecurityModule")
-    return hwp
+from hwp_file_manager import open_hwp, PRECOMPRESSED_EXTS, SECTION_RE, section_files
+from convert_hwp import hwp_pool
 
 
 class ExtractCellMeta:
     """HWP 테이블 셀 메타데이터 추출"""
 
     def __init__(self, hwp=None):
-        self.hwp = hwp or get_or_create_hwp()
+        # 인스턴스 미지정 시 변환 모듈과 같은 풀의 한글 재사용
+        self.hwp = hwp or hwp_pool.get()
         if not self.hwp:
             raise RuntimeError("한글에 연결할 수 없습니다.")
 
-    def extract(self, hwp_path: str, output_yaml: str = None) -> str:
+        # 저장 시 매번 HAction/HParameterSet 체인을 조회하지 않도록 핸들 캐시
+        self._action = self.hwp.HAction
+        self._file_pset = self.hwp.HParameterSet.HFileOpenSave
+
+    def extract(self, hwp_path: str, output_yaml: str = None, verify_com: bool = False) -> str:
         """
         HWP 파일에서 셀 메타데이터 추출하여 YAML로 저장
 
         Args:
             hwp_path: HWP 파일 경로
             output_yaml: 출력 YAML 경로 (없으면 자동 생성)
+            verify_com: True면 셀 list_id를 COM 순회 결과와 대조 (느림)
 
         Returns:
             생성된 YAML 파일 경로
@@ -79,29 +192,38 @@ class ExtractCellMeta:
         if output_yaml is None:
             output_yaml = os.path.splitext(hwp_path)[0] + "_meta.yaml"
 
-        # 1. HWP 파일 열기
-        open_hwp(self.hwp,hwp_path)
+        # 외부에서 받은 인스턴스여도 열기/저장 중 대화상자가 뜨지 않도록 (종료 시 원래 모드 복원)
+        prev_mode = self.hwp.SetMessageBoxMode(0x7FFFFFFF)
+        try:
+            # 1. HWP 파일 열기
+            open_hwp(self.hwp,hwp_path)
 
-        # 2. 임시 HWPX로 저장
-        temp_dir = tempfile.gettempdir()
-        temp_hwpx = os.path.join(temp_dir, "temp_extract_meta.hwpx")
-        self._save_as(temp_hwpx, "HWPX")
+            # 2. 임시 HWPX로 저장
+            temp_hwpx = str(hwp_pool.scratch / "extract_meta.hwpx")
+            self._save_as(temp_hwpx, "HWPX")
 
-        # 3. COM API로 각 셀의 list_id, para_id 추출
-        cell_positions = self._extract_cell_positions()
+            # 테이블이 없는 문서는 셀 추출/필드 삭제 단계를 건너뜀
+            has_tables = _has_tables(temp_hwpx)
 
-        # 4. HWPX에서 field_name (tc.name 속성) 추출
-        field_names = self._extract_field_names_from_hwpx(temp_hwpx)
+            if has_tables:
+                # 3. HWPX에서 field_name (tc.name 속성) 추출
+                field_names = self._extract_field_names_from_hwpx(temp_hwpx)
 
-        # 5. 병합하여 YAML 생성
-        yaml_content = self._merge_to_yaml(cell_positions, field_names)
+                # 4. 각 셀의 list_id, para_id 추출 (HWPX 셀 순서 기반, COM은 테이블당 첫 셀만)
+                cell_positions = self._extract_cell_positions(field_names, verify_com)
+            else:
+                field_names, cell_positions = [], []
 
-        # 6. YAML 저장
-        with open(output_yaml, 'w', encoding='utf-8') as f:
-            f.write(yaml_content)
+            # 5~6. 병합하여 YAML 파일에 바로 기록 (전체 문자열을 만들지 않음)
+            with open(output_yaml, 'w', encoding='utf-8') as f:
+                self._merge_to_yaml(cell_positions, field_names, f)
 
-        # 7. tc.name 속성 삭제 후 HWP 저장
-        self._clear_field_names_and_save(temp_hwpx, hwp_path)
+            # 7. tc.name 속성 삭제 후 HWP 저장
+            # (이름 붙은 셀이 없으면 원본과 같으므로 ZIP 재작성/재열기/재저장 생략)
+            if any(cell['field_name'] for table in field_names for cell in table['cells']):
+                self._clear_field_names_and_save(temp_hwpx, hwp_path)
+        finally:
+            self.hwp.SetMessageBoxMode(prev_mode)
 
         # 8. 임시 파일 삭제
         try:
@@ -116,302 +238,465 @@ class ExtractCellMeta:
 
     def _clear_field_names_and_save(self, hwpx_path: str, output_hwp: str):
         """HWPX에서 tc.name 속성 삭제 후 HWP로 저장"""
-        import shutil
-
-        extract_dir = tempfile.mkdtemp()
         total_cleared = 0
+        rewritten_hwpx = hwpx_path + '.tmp'
 
-        try:
-            with zipfile.ZipFile(hwpx_path, 'r') as zf:
-                zf.extractall(extract_dir)
-
-            contents_dir = os.path.join(extract_dir, 'Contents')
-            section_files = sorted([
-                f for f in os.listdir(contents_dir)
-                if f.startswith('section') and f.endswith('.xml')
-            ])
-
-            for section_file in section_files:
-                section_path = os.path.join(contents_dir, section_file)
-                tree = ET.parse(section_path)
-                root = tree.getroot()
-
-                # 모든 tc 태그에서 name 속성 제거
-                for tc in root.iter():
-                    if tc.tag.endswith('}tc'):
+        # 압축 해제 없이 ZIP 항목을 스트리밍으로 복사 (section XML만 수정)
+        with zipfile.ZipFile(hwpx_path, 'r') as zf_in, \
+                zipfile.ZipFile(rewritten_hwpx, 'w', zipfile.ZIP_DEFLATED) as zf_out:
+            for info in zf_in.infolist():
+                data = zf_in.read(info)
+
+                if SECTION_RE.match(info.filename):
+                    tree = ET.parse(BytesIO(data))
+                    root = tree.getroot()
+
+                    # 모든 tc 태그에서 name 속성 제거
+                    for tc in root.iter(TAG_TC):
                         if 'name' in tc.attrib:
                             del tc.attrib['name']
                             total_cleared += 1
 
-                tree.write(section_path, encoding='utf-8', xml_declaration=True)
+                    buf = BytesIO()
+                    tree.write(buf, encoding='utf-8', xml_declaration=True)
+                    zf_out.writestr(info, buf.getvalue(), zipfile.ZIP_DEFLATED, 6)
+                    continue
 
-            # 수정된 HWPX 다시 압축
-            with zipfile.ZipFile(hwpx_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for root_dir, dirs, files in os.walk(extract_dir):
-                    for file in files:
-                        file_path = os.path.join(root_dir, file)
-                        arcname = os.path.relpath(file_path, extract_dir)
-                        zf.write(file_path, arcname)
+                # 이미지 등 압축된 바이너리는 재압축하지 않음
+                if (info.compress_type != zipfile.ZIP_STORED
+                        and os.path.splitext(info.filename)[1].lower() in PRECOMPRESSED_EXTS):
+                    info.compress_type = zipfile.ZIP_STORED
 
-            # 수정된 HWPX 열어서 HWP로 저장
-            open_hwp(self.hwp,hwpx_path)
-            self._save_as(output_hwp, "HWP")
-            print(f"필드 삭제 후 저장: {total_cleared}개 셀, {output_hwp}")
+                # 그 외 항목은 원본 ZipInfo 유지 (compress_type, 항목 순서 보존)
+                zf_out.writestr(info, data)
 
-        finally:
-            shutil.rmtree(extract_dir, ignore_errors=True)
+        os.replace(rewritten_hwpx, hwpx_path)
+
+        # 수정된 HWPX 열어서 HWP로 저장
+        open_hwp(self.hwp,hwpx_path)
+        self._save_as(output_hwp, "HWP")
+        print(f"필드 삭제 후 저장: {total_cleared}개 셀, {output_hwp}")
 
     def _save_as(self, filepath: str, format_type: str):
         """파일 저장"""
-        self.hwp.HAction.GetDefault("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
-        self.hwp.HParameterSet.HFileOpenSave.filename = filepath
-        self.hwp.HParameterSet.HFileOpenSave.Format = format_type
-        self.hwp.HAction.Execute("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
+        # HFileOpenSave는 FileOpen과 공유되므로 기본값은 매번 다시 로드
+        pset = self._file_pset
+        self._action.GetDefault("FileSaveAs_S", pset.HSet)
+        pset.FileName = filepath
+        pset.Format = format_type
+        self._action.Execute("FileSaveAs_S", pset.HSet)
+
+    def _extract_cell_positions(self, tables_xml: list = None, verify_com: bool = False) -> list:
+        """
+        모든 테이블 셀의 (row, col) -> (list_id, para_id) 추출
+
+        tables_xml(_extract_field_names_from_hwpx 결과)이 있으면 COM으로는 테이블마다
+        첫 셀 list_id만 읽고, 나머지 셀은 HWPX의 tc 순서로 계산 (셀 list_id는 행 우선 연속).
+        셀 순회와 같게 필드명(JSON)이 있는 셀만, 필드명의 (row, col)로 기록.
+        계산한 셀은 전부 SetPos로 이동해 필드명 주소를 확인하고 그 위치의 para_id를 기록.
+        tables_xml이 없거나, 계산 결과가 하나라도 맞지 않으면 커서로 셀을 직접 순회.
+        중첩 테이블을 가진 테이블은 중첩 셀 list_id가 부모 셀 사이에 끼므로 계산 없이 순회.
+        (HeadCtrl은 최상위 테이블만 나열하므로 중첩 테이블이 있는 문서는 개수 불일치로 전부 순회)
+
+        Args:
+            tables_xml: HWPX에서 추출한 테이블 목록 (None이면 전부 COM 순회)
+            verify_com: True면 COM 순회 결과와 비교해 불일치 출력 (COM 결과 반환)
+        """
+        if tables_xml is None:
+            return self._walk_cell_positions()
+
+        table_ctrls = self._table_ctrls()
+        if len(table_ctrls) != len(tables_xml):
+            # 컨트롤 수와 XML 테이블 수가 다르면 순서 대응을 신뢰할 수 없음
+            print(f"테이블 수 불일치 (COM {len(table_ctrls)}, HWPX {len(tables_xml)}): 셀 순회로 추출")
+            return self._walk_cell_positions()
+
+        # 중첩 테이블을 가진 테이블 인덱스
+        nested_parents = {
+            t['parent_tbl_idx'] for t in tables_xml if t['parent_tbl_idx'] is not None
+        }
 
-    def _extract_cell_positions(self) -> list:
-        """COM API로 모든 테이블 셀의 list_id + 필드명(JSON)에서 row/col 추출"""
         tables = []
-        ctrl = self.hwp.HeadCtrl
-        tbl_idx = 0
+        for tbl_idx, (ctrl, tbl_xml) in enumerate(zip(table_ctrls, tables_xml)):
+            table_data = {
+                'tbl_idx': tbl_idx,
+                'cells': {}  # (row, col) -> (list_id, para_id)
+            }
+            # tc 순서 인덱스 + 필드명 주소 (필드명 없는 셀은 셀 순회에서도 기록되지 않음)
+            named = [
+                (i, addr) for i, cell in enumerate(tbl_xml.get('cells', []))
+                if (addr := _field_addr(cell['field_name']))
+            ]
+            if not named:
+                # 필드명이 하나도 없으면 셀 순회 결과도 빈 테이블
+                tables.append(table_data)
+                continue
+
+            if tbl_idx in nested_parents:
+                # 중첩 테이블 셀이 부모 셀 list_id 사이에 번호를 차지하므로 tc 순서로 계산 불가
+                tables.append(self._walk_table_cells(
+                    ctrl, tbl_idx, (tbl_xml['row_count'], tbl_xml['col_count'])
+                ))
+                continue
+
+            first_list_id = self._first_cell_list_id(ctrl, tbl_idx)
+            # 병합 셀 등으로 중간부터 list_id가 밀릴 수 있으므로 필드명이 있는 셀은 전부 확인
+            positions = None
+            if first_list_id is not None:
+                positions = self._check_cell_positions(first_list_id, named)
+            if positions is None:
+                print(f"테이블 {tbl_idx}: 셀 list_id 계산 확인 실패, 셀 순회로 추출")
+                tables.append(self._walk_table_cells(
+                    ctrl, tbl_idx, (tbl_xml['row_count'], tbl_xml['col_count'])
+                ))
+                continue
+
+            set_cell = table_data['cells'].setdefault  # 같은 주소는 먼저 나온 셀 유지
+            for (_, (_, r, c)), pos in zip(named, positions):
+                set_cell((r, c), pos)
+            tables.append(table_data)
+
+        if verify_com:
+            com_tables = self._walk_cell_positions(
+                [(t['row_count'], t['col_count']) for t in tables_xml]
+            )
+            for derived, walked in zip(tables, com_tables):
+                diff = {
+                    k for k in set(derived['cells']) | set(walked['cells'])
+                    if derived['cells'].get(k, (None,))[0] != walked['cells'].get(k, (None,))[0]
+                }
+                if diff:
+                    print(f"테이블 {derived['tbl_idx']} list_id 불일치: {len(diff)}개 셀 {sorted(diff)[:5]}")
+            return com_tables
 
+        return tables
+
+    def _table_ctrls(self) -> list:
+        """문서의 테이블 컨트롤 목록 (HeadCtrl 순서)"""
+        ctrls = []
+        ctrl = self.hwp.HeadCtrl
         while ctrl:
             if ctrl.CtrlID == "tbl":
-                table_data = {
-                    'tbl_idx': tbl_idx,
-                    'cells': {}  # (row, col) -> (list_id, para_id)
-                }
+                ctrls.append(ctrl)
+            ctrl = ctrl.Next
+        return ctrls
 
-                try:
-                    # 테이블로 이동
-                    anchor = ctrl.GetAnchorPos(0)
-                    self.hwp.SetPosBySet(anchor)
-                    self.hwp.HAction.Run("SelectCtrlFront")
-                    self.hwp.HAction.Run("ShapeObjTableSelCell")
-
-                    first_list_id = self.hwp.GetPos()[0]
-
-                    # 행별 순회
-                    row = 0
-                    visited_cells = set()  # 무한루프 방지
-                    while row < 100:  # 안전장치
-                        # 행의 첫 열로 이동
-                        self.hwp.HAction.Run("TableColBegin")
-                        row_first_list_id = self.hwp.GetPos()[0]
-                        col = 0
-
-                        # 열 순회
-                        while col < 100:  # 안전장치
-                            pos = self.hwp.GetPos()
-                            list_id = pos[0]
-
-                            # 이미 방문한 셀이면 종료
-                            if list_id in visited_cells:
-                                break
-                            visited_cells.add(list_id)
-
-                            # GetCurFieldName(0)으로 필드명 가져오기
-                            field_name = ""
-                            try:
-                                field_name = self.hwp.GetCurFieldName(0) or ""
-                            except:
-                                pass
-
-                            # field_name에서 row/col 파싱
-                            if field_name:
-                                try:
-                                    fd = json.loads(field_name)
-                                    r = fd.get('rowAddr', 0)
-                                    c = fd.get('colAddr', 0)
-                                    para_id = pos[1]
-                                    if (r, c) not in table_data['cells']:
-                                        table_data['cells'][(r, c)] = (list_id, para_id)
-                                except:
-                                    pass
-
-                            # 오른쪽 셀로 이동
-                            prev_list_id = list_id
-                            self.hwp.HAction.Run("TableRightCell")
-                            new_pos = self.hwp.GetPos()
-
-                            # 같은 행의 처음으로 돌아왔거나 위치 변화 없으면 열 순회 종료
-                            if new_pos[0] == row_first_list_id or new_pos[0] == prev_list_id:
-                                break
-
-                            col += 1
-
-                        # 다음 행으로 이동
-                        prev_list_id = self.hwp.GetPos()[0]
-                        self.hwp.HAction.Run("TableLowerCell")
-                        new_pos = self.hwp.GetPos()
-
-                        # 첫 행으로 돌아왔거나 위치 변화 없으면 순회 종료
-                        if new_pos[0] == first_list_id or new_pos[0] == prev_list_id:
-                            break
-
-                        row += 1
-
-                    # 선택 해제
-                    self.hwp.HAction.Run("Cancel")
-                    self.hwp.HAction.Run("MoveParentList")
-
-                except Exception as e:
-                    print(f"테이블 {tbl_idx} 처리 오류: {e}")
+    def _first_cell_list_id(self, ctrl, tbl_idx: int):
+        """테이블 첫 셀의 list_id (실패 시 None)"""
+        try:
+            anchor = ctrl.GetAnchorPos(0)
+            self.hwp.SetPosBySet(anchor)
+            self.hwp.HAction.Run("SelectCtrlFront")
+            self.hwp.HAction.Run("ShapeObjTableSelCell")
+            first_list_id = self.hwp.GetPos()[0]
+            self.hwp.HAction.Run("Cancel")
+            self.hwp.HAction.Run("MoveParentList")
+            return first_list_id
+        except Exception as e:
+            print(f"테이블 {tbl_idx} 처리 오류: {e}")
+            return None
+
+    def _check_cell_positions(self, first_list_id: int, named: list) -> Optional[list]:
+        """
+        named의 (tc 순서 i, 필드명 주소)마다 first_list_id + i 위치로 이동해 확인
 
-                tables.append(table_data)
-                tbl_idx += 1
+        셀 필드명 주소(row, col)가 모두 맞으면 셀별 실제 (list_id, para_id) 목록,
+        하나라도 다르거나 COM 오류로 확인할 수 없으면 None (호출 측이 셀 순회로 대체)
+        """
+        set_pos = self.hwp.SetPos
+        get_pos = self.hwp.GetPos
+        get_field = self.hwp.GetCurFieldName
+        positions = []
+        try:
+            for i, expected in named:
+                list_id = first_list_id + i
+                set_pos(list_id, 0, 0)
+                pos = get_pos()
+                found = _field_addr(get_field(0) or "")
+                if pos[0] != list_id or not found or found[1:] != expected[1:]:
+                    return None
+                positions.append((list_id, pos[1]))
+            self.hwp.HAction.Run("MoveParentList")
+        except Exception:
+            return None
+        return positions
+
+    def _walk_cell_positions(self, dims: list = None) -> list:
+        """
+        COM API로 모든 테이블 셀을 순회하며 list_id + 필드명(JSON)에서 row/col 추출
 
-            ctrl = ctrl.Next
+        Args:
+            dims: 테이블별 (row_count, col_count) - HWPX tbl 속성값 (없으면 최대 100x100)
+        """
+        table_ctrls = self._table_ctrls()
+        if not self._has_cell_fields():
+            # 셀 필드명이 없으면 순회해도 (row, col)을 알 수 없음
+            return [{'tbl_idx': tbl_idx, 'cells': {}} for tbl_idx in range(len(table_ctrls))]
+        return [
+            self._walk_table_cells(ctrl, tbl_idx, dims[tbl_idx] if dims else None)
+            for tbl_idx, ctrl in enumerate(table_ctrls)
+        ]
 
-        return tables
+    def _has_cell_fields(self) -> bool:
+        """문서에 셀 필드명이 하나라도 있는지 (GetFieldList 1회 호출)"""
+        try:
+            return bool(self.hwp.GetFieldList(0, 1))  # 1: 셀 필드
+        except Exception:
+            return True  # 확인 못 하면 순회
+
+    def _walk_table_cells(self, ctrl, tbl_idx: int, dims: tuple = None) -> dict:
+        """테이블 하나의 셀을 커서로 순회하며 (row, col) -> (list_id, para_id) 추출"""
+        # 순회 상한: HWPX rowCnt/colCnt (모르면 100x100 안전장치)
+        max_rows, max_cols = dims if dims else (100, 100)
+        table_data = {
+            'tbl_idx': tbl_idx,
+            'cells': {}  # (row, col) -> (list_id, para_id)
+        }
+
+        try:
+            # 테이블로 이동
+            anchor = ctrl.GetAnchorPos(0)
+            self.hwp.SetPosBySet(anchor)
+            self.hwp.HAction.Run("SelectCtrlFront")
+            self.hwp.HAction.Run("ShapeObjTableSelCell")
+
+            first_list_id = self.hwp.GetPos()[0]
+
+            # 행별 순회
+            row = 0
+            visited_cells = set()  # 무한루프 방지
+            while row < max_rows:
+                # 행의 첫 열로 이동
+                self.hwp.HAction.Run("TableColBegin")
+                row_first_list_id = self.hwp.GetPos()[0]
+                col = 0
+
+                # 열 순회
+                while col < max_cols:
+                    pos = self.hwp.GetPos()
+                    list_id = pos[0]
+
+                    # 이미 방문한 셀이면 종료
+                    if list_id in visited_cells:
+                        break
+                    visited_cells.add(list_id)
+
+                    # GetCurFieldName(0)으로 필드명 가져오기
+                    field_name = ""
+                    try:
+                        field_name = self.hwp.GetCurFieldName(0) or ""
+                    except:
+                        pass
+
+                    # field_name에서 row/col 파싱
+                    addr = _field_addr(field_name)
+                    if addr:
+                        _, r, c = addr
+                        table_data['cells'].setdefault((r, c), (list_id, pos[1]))
+
+                    # 오른쪽 셀로 이동
+                    prev_list_id = list_id
+                    self.hwp.HAction.Run("TableRightCell")
+                    new_pos = self.hwp.GetPos()
+
+                    # 같은 행의 처음으로 돌아왔거나 위치 변화 없으면 열 순회 종료
+                    if new_pos[0] == row_first_list_id or new_pos[0] == prev_list_id:
+                        break
+
+                    col += 1
+
+                # 다음 행으로 이동
+                prev_list_id = self.hwp.GetPos()[0]
+                self.hwp.HAction.Run("TableLowerCell")
+                new_pos = self.hwp.GetPos()
+
+                # 첫 행으로 돌아왔거나 위치 변화 없으면 순회 종료
+                if new_pos[0] == first_list_id or new_pos[0] == prev_list_id:
+                    break
+
+                row += 1
+
+            # 선택 해제
+            self.hwp.HAction.Run("Cancel")
+            self.hwp.HAction.Run("MoveParentList")
+
+        except Exception as e:
+            print(f"테이블 {tbl_idx} 처리 오류: {e}")
+
+        return table_data
 
     def _extract_field_names_from_hwpx(self, hwpx_path: str) -> list:
         """HWPX에서 테이블별 셀의 field_name (tc.name 속성) 추출"""
-        tables = []
-
         with zipfile.ZipFile(hwpx_path, 'r') as zf:
-            section_files = sorted([
-                f for f in zf.namelist()
-                if f.startswith('Contents/section') and f.endswith('.xml')
-            ])
+            section_names = section_files(zf.namelist())
+
+        # section은 서로 독립이므로 여러 개면 스레드로 동시에 파싱 (파서가 C 레벨에서 GIL 해제)
+        if len(section_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(section_names))) as ex:
+                per_section = list(ex.map(
+                    functools.partial(self._parse_section_file, hwpx_path), section_names
+                ))
+        else:
+            per_section = [self._parse_section_file(hwpx_path, sf) for sf in section_names]
+
+        # section 순서대로 합치면서 section 내부 인덱스를 문서 전체 인덱스로 보정
+        tables = []
+        for section_tables in per_section:
+            offset = len(tables)
+            for table in section_tables:
+                if table['parent_tbl_idx'] is not None:
+                    table['parent_tbl_idx'] += offset
+            tables.extend(section_tables)
 
-            for section_file in section_files:
-                xml_content = zf.read(section_file)
-                root = ET.parse(BytesIO(xml_content)).getroot()
-                self._find_tables_recursive(root, tables)
+        return tables
 
+    def _parse_section_file(self, hwpx_path: str, section_file: str) -> list:
+        """section XML 하나의 테이블 목록 (ZipFile은 스레드 간 공유하지 않고 호출마다 열기)"""
+        tables = []
+        with zipfile.ZipFile(hwpx_path, 'r') as zf, zf.open(section_file) as stream:
+            self._parse_section_tables(stream, tables)
         return tables
 
-    def _find_tables_recursive(self, element, tables: list, depth: int = 0, parent_tbl_idx: int = None):
-        """재귀적으로 테이블 찾아 셀 정보 추출"""
-        for child in element:
-            if child.tag.endswith('}tbl'):
-                current_tbl_idx = len(tables)
-                table_data = {
-                    'table_id': child.get('id', ''),
-                    'row_count': int(child.get('rowCnt', 0)),
-                    'col_count': int(child.get('colCnt', 0)),
+    def _parse_section_tables(self, stream, tables: list):
+        """
+        section XML을 iterparse로 스트리밍하며 테이블 셀 정보 추출
+
+        tbl 시작 시 문서 순서대로 인덱스 부여 (부모 테이블이 중첩 테이블보다 먼저),
+        tbl 종료 시 직속 tr/tc만 읽고 요소를 비워 메모리 사용량을 일정하게 유지
+        """
+        open_tbl_idxs = []  # 현재 열려 있는 tbl 인덱스 스택 (중첩 깊이)
+        root = None
+
+        if _HAVE_LXML:
+            # libxml2가 C 레벨에서 tbl 이벤트만 걸러냄
+            events = ET.iterparse(stream, events=('start', 'end'), tag=TAG_TBL)
+        else:
+            events = ET.iterparse(stream, events=('start', 'end'))
+
+        for event, elem in events:
+            if root is None:
+                root = elem
+            if elem.tag != TAG_TBL:
+                continue
+
+            if event == 'start':
+                depth = len(open_tbl_idxs)
+                open_tbl_idxs.append(len(tables))
+                tables.append({
+                    'table_id': elem.get('id', ''),
+                    'row_count': int(elem.get('rowCnt', 0)),
+                    'col_count': int(elem.get('colCnt', 0)),
                     'type': 'parent' if depth == 0 else 'nested',
                     'depth': depth,
-                    'parent_tbl_idx': parent_tbl_idx,
+                    'parent_tbl_idx': open_tbl_idxs[-2] if depth > 0 else None,
                     'cells': []
+                })
+                continue
+
+            table_data = tables[open_tbl_idxs.pop()]
+            self._read_table_cells(elem, table_data)
+
+            # 처리 끝난 테이블 해제 (최상위 테이블이면 이전 문단들도 해제)
+            elem.clear()
+            if not open_tbl_idxs:
+                if _HAVE_LXML:
+                    # lxml은 파싱 중인 조상을 지우면 안 되므로 앞쪽 형제만 삭제
+                    for ancestor in elem.iterancestors():
+                        while ancestor.getprevious() is not None:
+                            del ancestor.getparent()[0]
+                else:
+                    root.clear()
+
+    def _read_table_cells(self, tbl, table_data: dict):
+        """tbl 요소의 캡션과 직속 셀(tr/tc) 정보를 table_data에 채움"""
+        # 캡션 추출
+        for sub in tbl:
+            if sub.tag == TAG_CAPTION:
+                texts = []
+                for t in sub.iter(TAG_T):
+                    if t.text:
+                        texts.append(t.text)
+                table_data['caption'] = ''.join(texts)
+                break
+
+        # 셀 추출
+        get_handler = _CELL_HANDLERS.get
+        for tr in tbl:
+            if tr.tag != TAG_TR:
+                continue
+            for tc in tr:
+                if tc.tag != TAG_TC:
+                    continue
+
+                field_name = tc.get('name', '')
+                cell_data = {
+                    'field_name': field_name,
+                    'row': 0,
+                    'col': 0,
+                    'row_span': 1,
+                    'col_span': 1,
                 }
 
-                # 캡션 추출
-                for sub in child:
-                    if sub.tag.endswith('}caption'):
-                        texts = []
-                        for t in sub.iter():
-                            if t.tag.endswith('}t') and t.text:
-                                texts.append(t.text)
-                        table_data['caption'] = ''.join(texts)
-                        break
-
-                # 셀 추출
-                for tr in child:
-                    if not tr.tag.endswith('}tr'):
-                        continue
-                    for tc in tr:
-                        if not tc.tag.endswith('}tc'):
-                            continue
-
-                        cell_data = {
-                            'field_name': tc.get('name', ''),
-                            'row': 0,
-                            'col': 0,
-                            'row_span': 1,
-                            'col_span': 1,
-                        }
-
-                        for sub in tc:
-                            tag = sub.tag.split('}')[-1]
-                            if tag == 'cellAddr':
-                                cell_data['row'] = int(sub.get('rowAddr', 0))
-                                cell_data['col'] = int(sub.get('colAddr', 0))
-                            elif tag == 'cellSpan':
-                                cell_data['row_span'] = int(sub.get('rowSpan', 1))
-                                cell_data['col_span'] = int(sub.get('colSpan', 1))
-
-                        table_data['cells'].append(cell_data)
+                for sub in tc:
+                    handler = get_handler(sub.tag)
+                    if handler:
+                        handler(sub, cell_data)
 
-                tables.append(table_data)
+                table_data['cells'].append(cell_data)
 
-                # 중첩 테이블 재귀 탐색
-                for tr in child:
-                    if not tr.tag.endswith('}tr'):
-                        continue
-                    for tc in tr:
-                        if not tc.tag.endswith('}tc'):
-                            continue
-                        self._find_tables_recursive(tc, tables, depth + 1, current_tbl_idx)
-            else:
-                self._find_tables_recursive(child, tables, depth, parent_tbl_idx)
+    def _merge_to_yaml(self, cell_positions: list, field_names: list, stream=None) -> str:
+        """
+        COM API 결과와 HWPX 결과 병합하여 YAML 생성
 
-    def _merge_to_yaml(self, cell_positions: list, field_names: list) -> str:
-        """COM API 결과와 HWPX 결과 병합하여 YAML 생성"""
-        lines = [
+        stream(텍스트 파일 객체)을 주면 문자열 대신 stream에 바로 기록하고 None 반환
+        """
+        header = '\n'.join([
             '# HWP 테이블 셀 메타데이터',
             f'# 테이블 수: {len(field_names)}',
             '#',
             '# 셀 형식: [tblIdx, row, col, rowSpan, colSpan, list_id]',
+            '',
             ''
-        ]
-        lines.append('tables:')
-
-        # 먼저 parent별 nested 테이블 정보 수집
-        # parent_tbl_idx -> [(cell_row, cell_col, nested_tbl_idx), ...]
-        nested_info = {}
-        for tbl_idx, tbl_xml in enumerate(field_names):
-            if tbl_xml.get('cells'):
-                first_cell = tbl_xml['cells'][0]
-                if first_cell.get('field_name'):
-                    try:
-                        fd = json.loads(first_cell['field_name'])
-                        if fd.get('type') == 'nested' and fd.get('parentTbl') is not None:
-                            parent_idx = fd['parentTbl']
-                            parent_cell = fd.get('parentCell', [0, 0])
-                            if parent_idx not in nested_info:
-                                nested_info[parent_idx] = []
-                            nested_info[parent_idx].append((parent_cell[0], parent_cell[1], tbl_idx))
-                    except:
-                        pass
+        ])
 
+        tables = []
+        # nested 테이블 → parent 참조 (루프 후 parent의 nested_tables에 채움)
+        # [(parent_tbl_idx, cell_row, cell_col, nested_tbl_idx), ...]
+        nested_refs = []
         for tbl_idx, tbl_xml in enumerate(field_names):
-            lines.append(f'  - tbl_idx: {tbl_idx}')
-            lines.append(f'    table_id: "{tbl_xml.get("table_id", "")}"')
+            table = {
+                'tbl_idx': tbl_idx,
+                'table_id': tbl_xml.get('table_id', ''),
+            }
 
             # 첫 셀의 field_name에서 type, parentTbl, parentCell 파싱
             tbl_type = "parent"
             parent_tbl = None
             parent_cell = None
             if tbl_xml.get('cells'):
-                first_cell = tbl_xml['cells'][0]
-                if first_cell.get('field_name'):
-                    try:
-                        fd = json.loads(first_cell['field_name'])
-                        tbl_type = fd.get('type', 'parent')
-                        parent_tbl = fd.get('parentTbl')
-                        parent_cell = fd.get('parentCell')
-                    except:
-                        pass
+                fd = _field_data(tbl_xml['cells'][0])
+                if fd:
+                    tbl_type = fd.get('type', 'parent')
+                    parent_tbl = fd.get('parentTbl')
+                    parent_cell = fd.get('parentCell')
 
-            lines.append(f'    type: "{tbl_type}"')
+            table['type'] = tbl_type
             if tbl_type == 'nested' and parent_tbl is not None:
-                lines.append(f'    parent_tbl_idx: {parent_tbl}')
+                cell_rc = parent_cell or [0, 0]
+                nested_refs.append((parent_tbl, cell_rc[0], cell_rc[1], tbl_idx))
+                table['parent_tbl_idx'] = parent_tbl
                 if parent_cell:
-                    lines.append(f'    parent_cell: [{parent_cell[0]}, {parent_cell[1]}]')
+                    table['parent_cell'] = [parent_cell[0], parent_cell[1]]
                     # 부모 셀의 para_id 조회
                     if parent_tbl < len(cell_positions):
                         parent_com_cells = cell_positions[parent_tbl].get('cells', {})
                         parent_cell_pos = parent_com_cells.get((parent_cell[0], parent_cell[1]))
                         if parent_cell_pos and isinstance(parent_cell_pos, tuple):
-                            lines.append(f'    parent_para_id: {parent_cell_pos[1]}')
-            elif tbl_type == 'parent' and tbl_idx in nested_info:
-                # parent 테이블에 중첩 테이블 정보 추가
-                nested_list = nested_info[tbl_idx]
-                # [[row, col, nested_tbl_idx], ...] 형식
-                nested_str = ', '.join([f'[{r}, {c}, {n}]' for r, c, n in nested_list])
-                lines.append(f'    nested_tables: [{nested_str}]')
-            lines.append(f'    size: "{tbl_xml.get("row_count", 0)}x{tbl_xml.get("col_count", 0)}"')
+                            table['parent_para_id'] = parent_cell_pos[1]
+            elif tbl_type == 'parent':
+                # 중첩 테이블 정보 자리 (키 순서 유지용, 루프 후 채우거나 제거)
+                table['nested_tables'] = []
+            table['size'] = f'{tbl_xml.get("row_count", 0)}x{tbl_xml.get("col_count", 0)}'
 
             # COM API에서 가져온 list_id 매핑 (row, col) -> (list_id, para_id)
             com_cells = {}
@@ -421,53 +706,53 @@ class ExtractCellMeta:
             # list_range 계산 (min ~ max list_id)
             caption = tbl_xml.get('caption', '')
             if com_cells:
-                list_ids = [v[0] for v in com_cells.values()]
-                min_list_id = min(list_ids)
-                max_list_id = max(list_ids)
-                lines.append(f'    list_range: [{min_list_id}, {max_list_id}]')
+                # (list_id, para_id) 튜플은 list_id 우선 비교 → 임시 리스트 없이 C 레벨 min/max
+                min_list_id = min(com_cells.values())[0]
+                max_list_id = max(com_cells.values())[0]
+                table['list_range'] = [min_list_id, max_list_id]
 
                 # caption_list_id 처리
                 # parent: 항상 caption_list_id 존재 (첫 셀 list_id - 1)
                 # nested: caption이 있을 때만 caption_list_id 존재
-                if tbl_type == 'parent':
-                    caption_list_id = min_list_id - 1
-                    lines.append(f'    caption_list_id: {caption_list_id}')
-                elif tbl_type == 'nested' and caption:
-                    caption_list_id = min_list_id - 1
-                    lines.append(f'    caption_list_id: {caption_list_id}')
+                if tbl_type == 'parent' or (tbl_type == 'nested' and caption):
+                    table['caption_list_id'] = min_list_id - 1
                 else:
                     # nested이고 caption이 없으면 null
-                    lines.append(f'    caption_list_id: null')
+                    table['caption_list_id'] = None
             if caption:
-                caption_escaped = caption.replace('"', '\\"').replace('\n', ' ')
-                lines.append(f'    caption: "{caption_escaped}"')
-
-            lines.append('    cells:')
-
-            for cell in tbl_xml.get('cells', []):
-                row = cell['row']
-                col = cell['col']
-                row_span = cell['row_span']
-                col_span = cell['col_span']
-
-                # COM API에서 list_id 가져오기
-                cell_pos = com_cells.get((row, col), (0, 0))
-                list_id = cell_pos[0] if isinstance(cell_pos, tuple) else cell_pos
-
-                # field_name에서 tblIdx 파싱
-                field_tbl_idx = tbl_idx
-                if cell['field_name']:
-                    try:
-                        fd = json.loads(cell['field_name'])
-                        field_tbl_idx = fd.get('tblIdx', tbl_idx)
-                    except:
-                        pass
-
-                lines.append(f'      - [{field_tbl_idx}, {row}, {col}, {row_span}, {col_span}, {list_id}]')
-
-            lines.append('')
-
-        return '\n'.join(lines)
+                table['caption'] = caption.translate(_CAPTION_TRANS)
+
+            # [tblIdx(field_name 우선), row, col, rowSpan, colSpan, list_id(COM)]
+            table['cells'] = [
+                [
+                    _cell_tbl_idx(cell, tbl_idx),
+                    cell['row'], cell['col'], cell['row_span'], cell['col_span'],
+                    com_cells.get((cell['row'], cell['col']), (0, 0))[0],
+                ]
+                for cell in tbl_xml.get('cells', [])
+            ]
+
+            tables.append(table)
+
+        # parent 테이블에 중첩 테이블 정보 추가: [[row, col, nested_tbl_idx], ...]
+        for parent_idx, r, c, n in nested_refs:
+            if isinstance(parent_idx, int) and 0 <= parent_idx < len(tables) \
+                    and 'nested_tables' in tables[parent_idx]:
+                tables[parent_idx]['nested_tables'].append([r, c, n])
+        for table in tables:
+            if table.get('nested_tables') == []:
+                del table['nested_tables']
+
+        if stream is not None:
+            stream.write(header)
+            yaml.dump(
+                {'tables': tables}, stream, Dumper=_MetaDumper, allow_unicode=True, sort_keys=False
+            )
+            return None
+
+        return header + yaml.dump(
+            {'tables': tables}, Dumper=_MetaDumper, allow_unicode=True, sort_keys=False
+        )
 
 
 def extract_cell_meta(hwp_path: str, output_yaml: str = None) -> str:
@@ -477,14 +762,20 @@ def extract_cell_meta(hwp_path: str, output_yaml: str = None) -> str:
 
 
 if __name__ == "__main__":
-    # 테스트
-    hwp_path = sys.argv[1] if len(sys.argv) > 1 else r"C:\hwp_xml\test_rev2.hwp"
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HWP 셀 메타데이터 추출")
+    parser.add_argument("hwp_path", nargs="?", default=r"C:\hwp_xml\test_rev2.hwp")
+    parser.add_argument("--verify-com", action="store_true",
+                        help="셀 list_id를 COM 셀 순회 결과와 대조")
+    args = parser.parse_args()
+    hwp_path = args.hwp_path
 
     print(f"입력: {hwp_path}")
     print("=" * 60)
 
     extractor = ExtractCellMeta()
-    output = extractor.extract(hwp_path)
+    output = extractor.extract(hwp_path, verify_com=args.verify_com)
 
     print(f"출력: {output}")
     print()
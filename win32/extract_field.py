@@ -28,9 +28,9 @@ except ImportError:
         sys.path.insert(0, win32hwp_dir)
 
 try:
-    from hwp_file_manager import get_hwp_instance, create_hwp_instance, get_active_filepath
+    from hwp_file_manager import get_hwp_instance, create_hwp_instance, get_active_filepath, is_hwp_alive
 except ImportError:
-    from win32.hwp_file_manager import get_hwp_instance, create_hwp_instance, get_active_filepath
+    from win32.hwp_file_manager import get_hwp_instance, create_hwp_instance, get_active_filepath, is_hwp_alive
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 
@@ -51,19 +51,28 @@ FIELD_CLICKHERE = 2     # 누름틀 필드
 FIELD_NUMBER = 1        # {{#}} 형식 일련번호
 
 
+# 기본 한글 인스턴스 캐시 (ExtractField를 여러 번 만들어도 연결/보안 모듈 등록은 1회)
+_hwp_cache = None
+
+
+def _cached_hwp():
+    """열린 한글(없으면 새로 생성)을 한 번만 연결해 재사용 (한글이 종료되었으면 다시 연결)"""
+    global _hwp_cache
+    if not is_hwp_alive(_hwp_cache):
+        _hwp_cache = get_hwp_instance() or create_hwp_instance(visible=True)
+    return _hwp_cache
+
+
 class ExtractField:
     """HWP 필드 추출 및 삭제"""
 
     def __init__(self, hwp=None):
-        self.hwp = hwp
-        if not self.hwp:
-            self.hwp = get_hwp_instance()
-        if not self.hwp:
-            self.hwp = create_hwp_instance(visible=True)
+        self.hwp = hwp or _cached_hwp()
         if not self.hwp:
             raise RuntimeError("한글에 연결할 수 없습니다.")
 
         self.fields: List[FieldInfo] = []
+        self.field_option = 0  # self.fields를 추출할 때 사용한 필드 옵션 (GetCurFieldName 확인용)
 
     def extract_fields(self, option: int = 0) -> List[FieldInfo]:
         """
@@ -76,6 +85,7 @@ class ExtractField:
             필드 정보 리스트
         """
         self.fields = []
+        self.field_option = option
 
         # GetFieldList로 모든 필드 이름 가져오기
         field_list_str = self.hwp.GetFieldList(FIELD_NUMBER, option)
@@ -83,12 +93,20 @@ class ExtractField:
             print("  필드 없음")
             return self.fields
 
-        field_names = field_list_str.split('\x02')
-
-        for name in field_names:
-            if not name:
-                continue
+        field_names = [name for name in field_list_str.split('\x02') if name]
 
+        # 필드 텍스트는 이름을 \x02로 이어 한 번에 조회 (개수가 어긋나면 필드별 조회)
+        texts = None
+        try:
+            texts = (self.hwp.GetFieldText('\x02'.join(field_names)) or "").split('\x02')
+        except Exception:
+            pass
+        if texts is not None and len(texts) == len(field_names) + 1 and not texts[-1]:
+            texts.pop()  # 끝 구분자
+        if texts is None or len(texts) != len(field_names):
+            texts = None
+
+        for idx, name in enumerate(field_names):
             try:
                 # 필드로 이동하여 위치 정보 획득
                 if self.hwp.MoveToField(name, True, True, False):
@@ -98,8 +116,11 @@ class ExtractField:
                     char_pos = pos[2] if len(pos) > 2 else 0
 
                     # 필드 텍스트 획득
-                    text = self.hwp.GetFieldText(name) or ""
-                    text = text.strip('\x02')
+                    if texts is not None:
+                        text = texts[idx]
+                    else:
+                        text = self.hwp.GetFieldText(name) or ""
+                        text = text.strip('\x02')
 
                     field_info = FieldInfo(
                         name=name,
@@ -126,6 +147,7 @@ class ExtractField:
             필드 정보 리스트
         """
         self.fields = []
+        self.field_option = FIELD_CELL
 
         # HeadCtrl로 모든 테이블 순회
         ctrl = self.hwp.HeadCtrl
@@ -195,10 +217,16 @@ class ExtractField:
         if not self.fields:
             self.extract_fields()
 
-        for field in self.fields:
+        # 문서 뒤쪽 필드부터 삭제 (self.fields는 추출 순서 = 테이블/셀 순회 순서)
+        # 추출 시 기록한 위치로 바로 이동하고, 그 위치가 해당 필드가 아닐 때만 MoveToField로 검색
+        # GetCurFieldName은 {{#}} 일련번호 없이 이름만 반환하므로 이름 부분만 비교
+        for field in reversed(self.fields):
             try:
-                # 필드로 이동
-                if self.hwp.MoveToField(field.name, True, True, False):
+                # 필드로 이동 (SetPos는 유효한 위치면 항상 True이므로 필드 이름으로 확인)
+                at_field = (self.hwp.SetPos(field.list_id, field.para_id, field.char_pos)
+                            and self.hwp.GetCurFieldName(self.field_option)
+                            == field.name.split('{{', 1)[0])
+                if at_field or self.hwp.MoveToField(field.name, True, True, False):
                     # 필드 삭제 (텍스트는 유지, 필드 속성만 제거)
                     # UnsetFieldName: 현재 위치 필드 해제
                     self.hwp.HAction.Run("DeleteField")
@@ -225,10 +253,12 @@ class ExtractField:
             "fields:"
         ]
 
-        for f in self.fields:
-            # 텍스트에 특수문자 있으면 따옴표로 감싸기
-            text_escaped = f.text.replace('"', '\\"') if f.text else ""
-            lines.append(f"  - [\"{f.name}\", {f.list_id}, \"{text_escaped}\"]")
+        # 필드 행: 미리 바인딩한 % 템플릿으로 한 번에 포맷 (텍스트의 큰따옴표는 이스케이프)
+        row = '  - ["%s", %d, "%s"]'.__mod__
+        lines.extend([
+            row((f.name, f.list_id, f.text.replace('"', '\\"') if f.text else ""))
+            for f in self.fields
+        ])
 
         return "\n".join(lines)
 
@@ -265,7 +295,10 @@ class ExtractField:
         import zipfile
         import shutil
         import tempfile
-        import xml.etree.ElementTree as ET
+        try:
+            from lxml import etree as ET  # libxml2 파서 (설치된 경우)
+        except ImportError:
+            import xml.etree.ElementTree as ET
 
         if not self.fields:
             print("  복원할 필드 없음")
@@ -6,18 +6,149 @@
 """
 
 import sys
+import re
 import json
+import queue
+import threading
 import yaml
-from dataclasses import dataclass, field
+from itertools import groupby
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Optional, Any
 
+try:
+    from yaml import CSafeDumper as _Dumper  # libyaml C 에미터 (설치된 경우)
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# to_json 직렬화: orjson(C) 있으면 사용
+try:
+    import orjson
+
+    def _json_dumps(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def _json_dumps(data) -> str:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+try:
+    from lxml import etree as ET  # libxml2 파서 (설치된 경우)
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 try:
     from hwp_file_manager import open_hwp
 except ImportError:
     from win32.hwp_file_manager import open_hwp
 
 
-@dataclass
+# 0~255 -> "00"~"FF" (색상 변환 시 매번 포맷하지 않도록)
+_HEX = tuple(format(i, "02X") for i in range(256))
+
+
+def _rgb_to_hex(color_value: int) -> Optional[str]:
+    """색상값(0x00BBGGRR)을 hex 문자열로 변환"""
+    if color_value is None or color_value < 0:
+        return None
+    return "#" + _HEX[color_value & 0xFF] + _HEX[(color_value >> 8) & 0xFF] + _HEX[(color_value >> 16) & 0xFF]
+
+
+def _intern(value):
+    """문자열이면 sys.intern (문단마다 반복되는 글꼴/스타일 이름을 한 객체로 공유)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# CharShape 파라미터 항목 -> (CharStyle 속성, 변환 함수)
+_CHAR_SHAPE_ITEMS = (
+    ("FaceNameHangul", "font_name", _intern),  # 글꼴
+    ("Height", "font_size", lambda v: v / 100.0 if v else None),  # HWPUNIT -> pt
+    ("Bold", "bold", bool),
+    ("Italic", "italic", bool),
+    ("UnderlineType", "underline", lambda v: v > 0),
+    ("StrikeOutType", "strikeout", lambda v: v > 0),
+    ("TextColor", "text_color", _rgb_to_hex),
+    ("HighlightColor", "highlight_color", lambda v: _rgb_to_hex(v) if v and v != -1 else None),  # 형광펜
+)
+
+
+# COM 정렬/줄간격 타입(0부터 연속된 정수) -> 표시 문자열, 정수로 바로 인덱싱
+_ALIGN_TUP = ("양쪽", "왼쪽", "오른쪽", "가운데", "배분", "나눔")
+_LS_TUP = ("퍼센트", "고정값", "여백만", "최소")
+
+
+def _pos_key(list_id: int, para_id: int) -> int:
+    """문단 위치 키 (튜플 대신 정수, para_id는 list 안에서 수천 개까지 가능하므로 32비트 할당)"""
+    return (list_id << 32) | para_id
+
+
+def _enum_name(names: tuple, value) -> str:
+    """names[value], 범위 밖이거나 정수가 아니면 str(value)"""
+    if type(value) is int and 0 <= value < len(names):
+        return names[value]
+    return str(value)
+
+
+# HWPML2X 속성값 -> 표시 문자열 (COM 경로의 ALIGN_TYPES / LINE_SPACING_TYPES와 같은 이름)
+_HWPML_ALIGN = {
+    "Justify": "양쪽",
+    "Left": "왼쪽",
+    "Right": "오른쪽",
+    "Center": "가운데",
+    "Distribute": "배분",
+    "DistributeSpace": "나눔",
+}
+_HWPML_LINE_SPACING = {
+    "Percent": "퍼센트",
+    "Fixed": "고정값",
+    "BetweenLines": "여백만",
+    "AtLeast": "최소",
+}
+
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def _hwpml_int(elem, name: str, default: int = 0) -> int:
+    """HWPML 정수 속성 (없거나 숫자가 아니면 default)"""
+    if elem is None:
+        return default
+    try:
+        return int(elem.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# to_yaml / 스트리밍 기록에서 쓰는 헤더 주석
+_YAML_HEADER = """# 한글 문서 문단 스타일 정보
+#
+# 구조:
+#   list_id:                # 리스트 ID (본문=0, 테이블 셀=각각 고유 ID)
+#     - para_id:            # 문단 ID (해당 list_id 내 문단 순번)
+#       line_count:         # 줄 수
+#       start_char_id:      # 시작 char_id
+#       next_line_char_id:  # 다음 줄 시작 char_id (1줄이면 null)
+#       end_char_id:        # 마지막 char_id
+#       style_name:         # 문단 스타일 이름
+#       align:              # 정렬 (왼쪽/가운데/오른쪽/양쪽/배분)
+#       indent:             # 첫줄 들여쓰기 (HWPUNIT)
+#       margin_left:        # 왼쪽 여백
+#       margin_right:       # 오른쪽 여백
+#       line_spacing:       # 줄 간격
+#       line_spacing_type:  # 줄 간격 타입 (퍼센트/고정값/여백만/최소)
+#       space_before:       # 문단 앞 간격
+#       space_after:        # 문단 뒤 간격
+#       char_style:         # 글자 스타일
+#         font_name:        # 글꼴
+#         font_size:        # 크기 (pt)
+#         bold:             # 굵게
+#         italic:           # 기울임
+#         underline:        # 밑줄
+#         strikeout:        # 취소선
+#         text_color:       # 글자색 (RGB hex)
+#         highlight_color:  # 형광펜 색상
+
+"""
+
+
+@dataclass(slots=True)
 class CharStyle:
     """글자 스타일 정보"""
     font_name: Optional[str] = None  # 글꼴 이름
@@ -42,7 +173,7 @@ class CharStyle:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParaStyle:
     """문단 스타일 정보"""
     # 위치 정보
@@ -102,40 +233,44 @@ class ParaStyle:
         }
 
 
+def _child_paralists(elem):
+    """elem 아래에서 가장 가까운 PARALIST들을 문서 순서대로 반환 (PARALIST 안으로는 내려가지 않음)"""
+    for child in elem:
+        if child.tag == 'PARALIST':
+            yield child
+        else:
+            yield from _child_paralists(child)
+
+
 class GetParaStyle:
     """
     한글 COM API를 사용하여 문단/글자 스타일을 추출하는 클래스
     """
 
-    # 정렬 타입 매핑
-    ALIGN_TYPES = {
-        0: "양쪽",
-        1: "왼쪽",
-        2: "오른쪽",
-        3: "가운데",
-        4: "배분",
-        5: "나눔",
-    }
-
-    # 줄간격 타입 매핑
-    LINE_SPACING_TYPES = {
-        0: "퍼센트",
-        1: "고정값",
-        2: "여백만",
-        3: "최소",
-    }
-
-    def __init__(self, hwp=None):
+    # 정렬/줄간격 타입 매핑 (하위 호환용, 내부 조회는 _ALIGN_TUP / _LS_TUP)
+    ALIGN_TYPES = dict(enumerate(_ALIGN_TUP))
+    LINE_SPACING_TYPES = dict(enumerate(_LS_TUP))
+
+    def __init__(self, hwp=None, compute_line_info: bool = False):
         """
         초기화
 
         Args:
             hwp: 기존 한글 객체 (None이면 연결/생성 시도)
+            compute_line_info: 문단별 줄 수/줄 시작 char_id 계산 여부
+                (문단마다 MoveDown/MoveLineBegin/GetPos를 줄 수만큼 반복하므로 가장 느린 단계.
+                 False면 line_count=1, next_line_char_id=None, start_char_id=현재 위치)
         """
         self.hwp = hwp
+        self.compute_line_info = compute_line_info
         if self.hwp is None:
             self._init_hwp()
 
+        # 액션 이름 -> (action, parameter set) 캐시 (문단마다 CreateAction/CreateSet 하지 않도록)
+        self._action_sets = {}
+        # hwp.ParaShape / hwp.CharShape 속성을 쓸 수 없는 버전이면 여기에 속성 이름 기록
+        self._no_shape_props = set()
+
     def _init_hwp(self):
         """한글 COM 객체 초기화"""
         try:
@@ -192,28 +327,47 @@ class GetParaStyle:
         except:
             return 0, 0, 0
 
-    def _rgb_to_hex(self, color_value: int) -> str:
-        """색상값을 hex 문자열로 변환"""
-        if color_value is None or color_value < 0:
-            return None
-        r = color_value & 0xFF
-        g = (color_value >> 8) & 0xFF
-        b = (color_value >> 16) & 0xFF
-        return f"#{r:02X}{g:02X}{b:02X}"
+    def _get_action_set(self, action_name: str):
+        """
+        캐시한 액션의 파라미터셋에 현재 위치 값을 채워 반환
+
+        CreateAction/CreateSet은 액션별 1회만 호출하고, GetDefault는 매번 호출
+        """
+        cached = self._action_sets.get(action_name)
+        if cached is None:
+            act = self.hwp.CreateAction(action_name)
+            cached = self._action_sets[action_name] = (act, act.CreateSet())
+        act, pset = cached
+        act.GetDefault(pset)
+        return pset
+
+    def _get_shape_set(self, prop_name: str, action_name: str):
+        """
+        hwp.ParaShape / hwp.CharShape 속성으로 현재 위치의 모양 파라미터셋 조회
+
+        속성 조회 1회로 끝나며, 속성이 없는 버전에서는 액션 GetDefault 방식으로 대체
+        """
+        if prop_name not in self._no_shape_props:
+            try:
+                return getattr(self.hwp, prop_name)
+            except Exception:
+                self._no_shape_props.add(prop_name)
+        return self._get_action_set(action_name)
+
+    # 색상값을 hex 문자열로 변환 (모듈 함수 재사용)
+    _rgb_to_hex = staticmethod(_rgb_to_hex)
 
     def _get_para_shape(self) -> Dict[str, Any]:
         """현재 문단의 모양 정보 추출"""
         result = {}
 
         try:
-            # 문단 모양 대화상자 값 가져오기
-            act = self.hwp.CreateAction("ParagraphShape")
-            pset = act.CreateSet()
-            act.GetDefault(pset)
+            # 현재 문단 모양 가져오기
+            pset = self._get_shape_set("ParaShape", "ParagraphShape")
 
             # 정렬
             align_val = pset.Item("Align")
-            result['align'] = self.ALIGN_TYPES.get(align_val, str(align_val))
+            result['align'] = _enum_name(_ALIGN_TUP, align_val)
 
             # 들여쓰기/여백
             result['indent'] = pset.Item("Indent")  # 첫줄 들여쓰기
@@ -223,7 +377,7 @@ class GetParaStyle:
             # 줄 간격
             result['line_spacing'] = pset.Item("LineSpacing")
             ls_type = pset.Item("LineSpacingType")
-            result['line_spacing_type'] = self.LINE_SPACING_TYPES.get(ls_type, str(ls_type))
+            result['line_spacing_type'] = _enum_name(_LS_TUP, ls_type)
 
             # 문단 간격
             result['space_before'] = pset.Item("SpaceBeforePara")
@@ -239,64 +393,16 @@ class GetParaStyle:
         char_style = CharStyle()
 
         try:
-            # 글자 모양 대화상자 값 가져오기
-            act = self.hwp.CreateAction("CharShape")
-            pset = act.CreateSet()
-            act.GetDefault(pset)
-
-            # 글꼴
-            try:
-                face_name = pset.Item("FaceNameHangul")
-                char_style.font_name = face_name
-            except:
-                pass
+            # 현재 글자 모양 가져오기
+            pset = self._get_shape_set("CharShape", "CharShape")
 
-            # 글자 크기 (HWPUNIT -> pt 변환: /100)
-            try:
-                height = pset.Item("Height")
-                char_style.font_size = height / 100.0 if height else None
-            except:
-                pass
-
-            # 굵게/기울임
-            try:
-                char_style.bold = bool(pset.Item("Bold"))
-            except:
-                pass
-
-            try:
-                char_style.italic = bool(pset.Item("Italic"))
-            except:
-                pass
-
-            # 밑줄
-            try:
-                underline_type = pset.Item("UnderlineType")
-                char_style.underline = underline_type > 0
-            except:
-                pass
-
-            # 취소선
-            try:
-                strikeout_type = pset.Item("StrikeOutType")
-                char_style.strikeout = strikeout_type > 0
-            except:
-                pass
-
-            # 글자색
-            try:
-                text_color = pset.Item("TextColor")
-                char_style.text_color = self._rgb_to_hex(text_color)
-            except:
-                pass
-
-            # 형광펜
-            try:
-                highlight = pset.Item("HighlightColor")
-                if highlight and highlight != -1:
-                    char_style.highlight_color = self._rgb_to_hex(highlight)
-            except:
-                pass
+            item = pset.Item
+            for item_name, attr, conv in _CHAR_SHAPE_ITEMS:
+                try:
+                    value = item(item_name)
+                    setattr(char_style, attr, conv(value) if conv else value)
+                except:
+                    pass
 
         except Exception as e:
             pass
@@ -304,7 +410,22 @@ class GetParaStyle:
         return char_style
 
     def _get_para_text(self) -> str:
-        """현재 문단의 텍스트 추출 (해당 문단만)"""
+        """
+        현재 문단의 텍스트 추출 (해당 문단만)
+
+        InitScan/GetText로 현재 문단 범위만 읽어 블록 선택/해제와 커서 복귀를 생략
+        (스캔을 쓸 수 없으면 블록 선택 방식으로 대체)
+        """
+        try:
+            # 0x07: 컨트롤 제외 텍스트만 (하위 list 제외), 0x0033: 시작/끝 = 현재 문단
+            text = scan_text(self.hwp, 0x07, 0x0033)
+        except Exception:
+            return self._get_para_text_block()
+
+        return text.replace("\r\n", " ").replace("\n", " ").strip()
+
+    def _get_para_text_block(self) -> str:
+        """현재 문단의 텍스트 추출 (블록 선택 후 saveblock)"""
         try:
             # 현재 위치 저장
             orig_list, orig_para, _ = self._get_position()
@@ -356,21 +477,23 @@ class GetParaStyle:
         }
 
         try:
+            run = self.hwp.HAction.Run  # 루프에서 매번 HAction 조회하지 않도록 바인딩
+
             # 현재 위치 저장
             orig_list, orig_para, _ = self._get_position()
 
             # 문단 끝으로 이동해서 마지막 char_id 확인
-            self.hwp.HAction.Run("MoveParaEnd")
+            run("MoveParaEnd")
             _, _, end_char = self._get_position()
             result['end_char_id'] = end_char
 
             # 문단 시작으로 이동
-            self.hwp.HAction.Run("MoveParaBegin")
+            run("MoveParaBegin")
             _, _, start_char = self._get_position()
             result['start_char_id'] = start_char
 
             # 줄 시작으로 이동해서 첫 줄 시작 char_id 확인
-            self.hwp.HAction.Run("MoveLineBegin")
+            run("MoveLineBegin")
             _, _, line_start_char = self._get_position()
             # 문단 시작이 줄 시작보다 작으면 문단 시작 사용
             if start_char < line_start_char:
@@ -385,28 +508,26 @@ class GetParaStyle:
             prev_char = line_start_char
 
             for i in range(max_lines):
-                # 아래 줄로 이동
-                self.hwp.HAction.Run("MoveDown")
-                curr_list, curr_para, curr_char = self._get_position()
+                # 아래 줄로 이동 후 줄 시작에서 한 번만 위치 조회
+                # (줄 시작 char_id가 이전 줄과 같으면 더 내려가지 못한 것)
+                run("MoveDown")
+                run("MoveLineBegin")
+                curr_list, curr_para, line_begin_char = self._get_position()
 
                 # para_id가 바뀌면 다른 문단으로 넘어간 것
                 if curr_para != orig_para or curr_list != orig_list:
                     break
 
-                # char_id가 변하지 않으면 마지막 줄
-                if curr_char == prev_char:
+                # 줄 시작 char_id가 변하지 않으면 마지막 줄
+                if line_begin_char == prev_char:
                     break
 
                 # char_id가 end_char를 넘어가면 종료
-                if curr_char > end_char:
+                if line_begin_char > end_char:
                     break
 
                 line_count += 1
 
-                # 줄 시작으로 이동해서 정확한 줄 시작 char_id 확인
-                self.hwp.HAction.Run("MoveLineBegin")
-                _, _, line_begin_char = self._get_position()
-
                 # 첫 번째 다음 줄의 시작 char_id 저장
                 if i == 0:
                     next_line_char_id = line_begin_char
@@ -428,19 +549,17 @@ class GetParaStyle:
         """현재 문단의 스타일 이름 추출"""
         try:
             # 스타일 정보 가져오기
-            act = self.hwp.CreateAction("Style")
-            pset = act.CreateSet()
-            act.GetDefault(pset)
+            pset = self._get_action_set("Style")
 
             style_name = pset.Item("Name")
-            return style_name if style_name else None
+            return _intern(style_name) if style_name else None
         except:
             return None
 
     def _extract_para_at_current_pos(self, visited: set) -> Optional[ParaStyle]:
         """현재 위치에서 문단 스타일 추출"""
-        list_id, para_id, _ = self._get_position()
-        pos_key = (list_id, para_id)
+        list_id, para_id, char_id = self._get_position()
+        pos_key = _pos_key(list_id, para_id)
 
         if pos_key in visited:
             return None
@@ -453,12 +572,15 @@ class GetParaStyle:
         # 문단 텍스트
         para_style.text = self._get_para_text()
 
-        # 줄 수 및 char_id 정보 계산
-        line_info = self._get_para_line_info()
-        para_style.line_count = line_info['line_count']
-        para_style.start_char_id = line_info['start_char_id']
-        para_style.next_line_char_id = line_info['next_line_char_id']
-        para_style.end_char_id = line_info['end_char_id']
+        # 줄 수 및 char_id 정보 계산 (compute_line_info=False면 기본값)
+        if self.compute_line_info:
+            line_info = self._get_para_line_info()
+            para_style.line_count = line_info['line_count']
+            para_style.start_char_id = line_info['start_char_id']
+            para_style.next_line_char_id = line_info['next_line_char_id']
+            para_style.end_char_id = line_info['end_char_id']
+        else:
+            para_style.start_char_id = char_id
 
         # 스타일 이름
         para_style.style_name = self._get_style_name()
@@ -490,7 +612,7 @@ class GetParaStyle:
             iteration += 1
 
             list_id, para_id, _ = self._get_position()
-            pos_key = (list_id, para_id)
+            pos_key = _pos_key(list_id, para_id)
 
             # 이미 방문한 경우 다음으로 이동
             if pos_key in visited:
@@ -499,10 +621,10 @@ class GetParaStyle:
                 self.hwp.HAction.Run("MoveNextPara")
                 new_list_id, new_para_id, _ = self._get_position()
 
-                if (new_list_id, new_para_id) == prev_pos:
+                if _pos_key(new_list_id, new_para_id) == prev_pos:
                     self.hwp.HAction.Run("MoveRight")
                     new_list_id, new_para_id, _ = self._get_position()
-                    if (new_list_id, new_para_id) == prev_pos:
+                    if _pos_key(new_list_id, new_para_id) == prev_pos:
                         break
                 continue
 
@@ -516,77 +638,267 @@ class GetParaStyle:
             self.hwp.HAction.Run("MoveNextPara")
 
             new_list_id, new_para_id, _ = self._get_position()
-            if (new_list_id, new_para_id) == prev_pos:
+            if _pos_key(new_list_id, new_para_id) == prev_pos:
                 self.hwp.HAction.Run("MoveRight")
                 new_list_id, new_para_id, _ = self._get_position()
-                if (new_list_id, new_para_id) == prev_pos:
+                if _pos_key(new_list_id, new_para_id) == prev_pos:
                     break
 
         return para_styles
 
-    def get_all_para_styles(self) -> List[ParaStyle]:
+    def _traverse_list(self, list_id: int, visited: set) -> List[ParaStyle]:
+        """list_id의 첫 문단부터 MoveNextPara로 이동하며 같은 list의 문단 추출"""
+        para_styles = []
+        run = self.hwp.HAction.Run
+
+        self.hwp.SetPos(list_id, 0, 0)
+        curr_list, curr_para, _ = self._get_position()
+        while curr_list == list_id:
+            ps = self._extract_para_at_current_pos(visited)
+            if ps:
+                para_styles.append(ps)
+
+            # 다음 문단으로 이동 (위치가 그대로면 list의 마지막 문단)
+            run("MoveNextPara")
+            next_list, next_para, _ = self._get_position()
+            if (next_list, next_para) == (curr_list, curr_para):
+                break
+            curr_list, curr_para = next_list, next_para
+
+        return para_styles
+
+    def get_all_para_styles(self, with_line_info: Optional[bool] = None) -> List[ParaStyle]:
         """
         문서의 모든 문단 스타일 정보 추출 (테이블 셀 포함)
 
-        list_id를 순차적으로 조회하여 모든 문단 추출
+        list_id를 순차적으로 조회하고, 각 list 안에서는 MoveNextPara로 문단을 따라가며 추출
+
+        Args:
+            with_line_info: 줄 정보 계산 여부 (None이면 생성자의 compute_line_info 사용)
 
         Returns:
             ParaStyle 리스트
         """
+        para_styles = list(self.iter_para_styles(with_line_info))
+
+        # list_id 순으로 정렬
+        para_styles.sort(key=lambda x: (x.list_id, x.para_id))
+
+        return para_styles
+
+    def iter_para_styles(self, with_line_info: Optional[bool] = None):
+        """
+        get_all_para_styles와 같은 순회를 하되 ParaStyle을 추출하는 즉시 하나씩 반환
+
+        list_id 오름차순, list 안에서는 para_id 순서로 나옴
+        """
         if self.hwp is None:
             raise RuntimeError("한글 문서가 열려있지 않습니다.")
 
-        para_styles = []
-        visited = set()  # (list_id, para_id) 중복 방지
+        prev_line_info = self.compute_line_info
+        if with_line_info is not None:
+            self.compute_line_info = with_line_info
 
-        # list_id를 0부터 순차적으로 조회
-        max_list_id = 1000  # 충분히 큰 값
-        consecutive_failures = 0
+        try:
+            visited = set()  # _pos_key(list_id, para_id) 중복 방지
+
+            # list_id를 0부터 순차적으로 조회
+            max_list_id = 1000  # 충분히 큰 값
+            consecutive_failures = 0
+
+            for list_id in range(max_list_id):
+                # 해당 list_id로 이동 시도
+                try:
+                    self.hwp.SetPos(list_id, 0, 0)
+                    curr_list, curr_para, _ = self._get_position()
+
+                    # 이동 성공 확인
+                    if curr_list != list_id:
+                        consecutive_failures += 1
+                        if consecutive_failures > 50:
+                            break
+                        continue
 
-        for list_id in range(max_list_id):
-            # 해당 list_id로 이동 시도
-            try:
-                self.hwp.SetPos(list_id, 0, 0)
-                curr_list, curr_para, _ = self._get_position()
+                    consecutive_failures = 0
 
-                # 이동 성공 확인
-                if curr_list != list_id:
+                    # 해당 list_id의 모든 문단 추출 (문단마다 SetPos 탐색하지 않고 순서대로 이동)
+                    yield from self._traverse_list(list_id, visited)
+
+                except Exception as e:
                     consecutive_failures += 1
                     if consecutive_failures > 50:
                         break
-                    continue
 
-                consecutive_failures = 0
+            print(f"  총 {len(visited)}개 문단 추출")
+        finally:
+            # 호출 단위 설정이므로 끝나면(중단 포함) 생성자 설정으로 복원
+            self.compute_line_info = prev_line_info
 
-                # 해당 list_id의 모든 문단 추출
-                for para_idx in range(100):
-                    self.hwp.SetPos(list_id, para_idx, 0)
-                    actual_list, actual_para, _ = self._get_position()
+    def get_all_para_styles_fast(self) -> List[ParaStyle]:
+        """
+        HWPML2X 한 번 내보내기로 모든 문단 스타일 추출 (문단별 COM 호출 없음)
 
-                    # list_id가 바뀌면 해당 list_id 끝
-                    if actual_list != list_id:
-                        break
+        GetTextFile("HWPML2X")로 문서 XML을 받아 문단/글자 모양, 스타일을 id로 조회합니다.
+        list_id는 본문=0, 이후 PARALIST(셀, 캡션, 머리말 등)를 문서 순서대로 1부터 부여하고,
+        list별 문단 수와 첫/마지막 문단 텍스트를 SetPos 위치에서 COM으로 확인해
+        어긋나거나 순서가 바뀌어도 구분할 수 없으면 get_all_para_styles(COM 순회)로 대체합니다.
 
-                    # para_id가 다르면 해당 para_id 없음
-                    if actual_para != para_idx:
-                        continue
+        Note:
+            - 줄 정보(line_count, next_line_char_id, end_char_id)는 계산하지 않음 (기본값)
+            - 형광펜 색상은 HWPML에 없으므로 None
 
-                    ps = self._extract_para_at_current_pos(visited)
-                    if ps:
-                        para_styles.append(ps)
+        Returns:
+            ParaStyle 리스트
+        """
+        if self.hwp is None:
+            raise RuntimeError("한글 문서가 열려있지 않습니다.")
 
-            except Exception as e:
-                consecutive_failures += 1
-                if consecutive_failures > 50:
-                    break
+        para_styles = None
+        try:
+            xml_text = self.hwp.GetTextFile("HWPML2X", "")
+            if xml_text:
+                para_styles = self._para_styles_from_hwpml(xml_text)
+        except Exception as e:
+            print(f"  HWPML 추출 실패: {e}")
 
-        print(f"  총 {len(visited)}개 문단 추출")
+        if not para_styles or not self._check_hwpml_lists(para_styles):
+            print("  HWPML 결과를 사용할 수 없어 COM 순회로 추출")
+            return self.get_all_para_styles()
 
-        # list_id 순으로 정렬
+        print(f"  총 {len(para_styles)}개 문단 추출 (HWPML)")
         para_styles.sort(key=lambda x: (x.list_id, x.para_id))
+        return para_styles
+
+    def _para_styles_from_hwpml(self, xml_text: str) -> List[ParaStyle]:
+        """HWPML2X 문자열에서 문단별 ParaStyle 생성"""
+        # 문자열 파싱 시 encoding 선언(UTF-16 등)이 있으면 lxml이 거부하므로 제거
+        root = ET.fromstring(_XML_DECL_RE.sub('', xml_text, count=1))
+
+        # 헤더 매핑 테이블 (id -> 요소)
+        fonts = {}
+        for face in root.iter('FONTFACE'):
+            if face.get('Lang') == 'Hangul':
+                fonts = {f.get('Id'): f.get('Name') for f in face.iter('FONT')}
+                break
+        char_shapes = {e.get('Id'): e for e in root.iter('CHARSHAPE')}
+        para_shapes = {e.get('Id'): e for e in root.iter('PARASHAPE')}
+        style_names = {e.get('Id'): e.get('Name') or None for e in root.iter('STYLE')}
+
+        char_cache = {}
+
+        def char_style_of(shape_id) -> Optional[CharStyle]:
+            if shape_id in char_cache:
+                return char_cache[shape_id]
+            shape = char_shapes.get(shape_id)
+            cs = None
+            if shape is not None:
+                height = _hwpml_int(shape, 'Height')
+                underline = shape.find('UNDERLINE')
+                strikeout = shape.find('STRIKEOUT')
+                font_id = shape.find('FONTID')
+                cs = CharStyle(
+                    font_name=fonts.get(font_id.get('Hangul')) if font_id is not None else None,
+                    font_size=height / 100.0 if height else None,
+                    bold=shape.find('BOLD') is not None,
+                    italic=shape.find('ITALIC') is not None,
+                    underline=underline is not None and underline.get('Type', 'None') != 'None',
+                    strikeout=strikeout is not None and strikeout.get('Type', 'None') != 'None',
+                    text_color=_rgb_to_hex(_hwpml_int(shape, 'TextColor', -1)),
+                )
+            char_cache[shape_id] = cs
+            return cs
+
+        para_styles = []
+        next_list_id = [1]
+
+        def visit_list(container, list_id: int, para_id: int = 0) -> int:
+            for p in container:
+                if p.tag != 'P':
+                    continue
+                texts = p.findall('TEXT')
+                shape = para_shapes.get(p.get('ParaShape'))
+                margin = shape.find('PARAMARGIN') if shape is not None else None
+
+                ps = ParaStyle(list_id=list_id, para_id=para_id)
+                ps.text = ''.join(
+                    ''.join(ch.itertext()) for t in texts for ch in t.findall('CHAR')
+                ).replace("\r\n", " ").replace("\n", " ").strip()
+                ps.style_name = style_names.get(p.get('Style'))
+                if shape is not None:
+                    align = shape.get('Align')
+                    ps.align = _HWPML_ALIGN.get(align, align)
+                if margin is not None:
+                    ps.indent = _hwpml_int(margin, 'Indent')
+                    ps.margin_left = _hwpml_int(margin, 'Left')
+                    ps.margin_right = _hwpml_int(margin, 'Right')
+                    ps.line_spacing = _hwpml_int(margin, 'LineSpacing')
+                    ls_type = margin.get('LineSpacingType')
+                    ps.line_spacing_type = _HWPML_LINE_SPACING.get(ls_type, ls_type)
+                    ps.space_before = _hwpml_int(margin, 'Prev')
+                    ps.space_after = _hwpml_int(margin, 'Next')
+                cs = char_style_of(texts[0].get('CharShape')) if texts else None
+                ps.char_style = replace(cs) if cs else None  # 문단마다 별도 객체
+                para_styles.append(ps)
+                para_id += 1
+
+                # 문단 안의 하위 list (셀, 캡션, 글상자 등)는 만나는 순서대로 번호 부여
+                for sub in _child_paralists(p):
+                    sub_id = next_list_id[0]
+                    next_list_id[0] += 1
+                    visit_list(sub, sub_id)
+            return para_id
+
+        # 본문은 모든 구역이 list_id 0 (문단 번호는 구역을 이어서 증가)
+        body_para = 0
+        for section in root.iter('SECTION'):
+            body_para = visit_list(section, 0, body_para)
 
         return para_styles
 
+    def _check_hwpml_lists(self, para_styles: List[ParaStyle]) -> bool:
+        """
+        HWPML 순서로 매긴 list_id/para_id가 실제 문서와 맞는지 SetPos로 확인
+
+        - list마다 마지막 문단까지만 있는지, 마지막 list 뒤에 다른 list가 없는지
+        - list마다 첫/마지막 문단 텍스트가 그 위치에서 COM으로 읽은 텍스트와 같은지
+        - 문단 수와 첫/마지막 텍스트가 같은 list끼리는 서로 바뀌어도 검사로 알 수 없으므로
+          내용이 완전히 같을 때만 사용 (다르면 False)
+        """
+        by_list = {}
+        for ps in para_styles:
+            by_list.setdefault(ps.list_id, []).append(ps)
+
+        # 검사로 구분되지 않는 list끼리는 id를 뺀 내용이 같아야 순서가 바뀌어도 결과가 같음
+        contents = {}
+        for paras in by_list.values():
+            key = (len(paras), paras[0].text, paras[-1].text)
+            content = [replace(ps, list_id=0, para_id=0) for ps in paras]
+            if contents.setdefault(key, content) != content:
+                return False
+
+        try:
+            for list_id, paras in by_list.items():
+                for ps in (paras[0], paras[-1]):
+                    self.hwp.SetPos(list_id, ps.para_id, 0)
+                    if self._get_position()[:2] != (list_id, ps.para_id):
+                        return False
+                    if self._get_para_text() != ps.text:
+                        return False
+                last_para = paras[-1].para_id
+                self.hwp.SetPos(list_id, last_para + 1, 0)
+                if self._get_position()[:2] == (list_id, last_para + 1):
+                    return False
+
+            # HWPML에서 못 찾은 list가 더 있으면 사용 불가
+            extra_list = max(by_list) + 1
+            self.hwp.SetPos(extra_list, 0, 0)
+            if self._get_position()[0] == extra_list:
+                return False
+            self.hwp.SetPos(0, 0, 0)
+        except Exception:
+            return False
+        return True
+
     def get_para_styles_by_list_id(self) -> Dict[int, List[ParaStyle]]:
         """
         list_id별로 그룹화된 문단 스타일 정보 반환
@@ -598,67 +910,75 @@ class GetParaStyle:
 
         grouped = {}
         for style in all_styles:
-            if style.list_id not in grouped:
-                grouped[style.list_id] = []
-            grouped[style.list_id].append(style)
+            grouped.setdefault(style.list_id, []).append(style)
 
         return grouped
 
     def to_json(self, para_styles: List[ParaStyle]) -> str:
         """ParaStyle 리스트를 JSON 문자열로 변환"""
-        data = [ps.to_dict() for ps in para_styles]
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return _json_dumps([ps.to_dict() for ps in para_styles])
 
-    def to_yaml(self, para_styles: List[ParaStyle]) -> str:
-        """ParaStyle 리스트를 YAML 문자열로 변환 (list_id별 그룹화, 주석 포함)"""
+    def to_yaml(self, para_styles: List[ParaStyle], stream=None) -> str:
+        """
+        ParaStyle 리스트를 YAML 문자열로 변환 (list_id별 그룹화, 주석 포함)
+
+        stream(텍스트 파일 객체)을 주면 문자열을 만들지 않고 stream에 바로 기록하고 None 반환
+        """
         # list_id별로 그룹화
         grouped = {}
         for ps in para_styles:
-            if ps.list_id not in grouped:
-                grouped[ps.list_id] = []
             # list_id는 키로 사용하므로 개별 항목에서 제외
             item = ps.to_dict()
             del item['list_id']
-            grouped[ps.list_id].append(item)
+            grouped.setdefault(ps.list_id, []).append(item)
 
-        # 헤더 주석
-        header = """# 한글 문서 문단 스타일 정보
-#
-# 구조:
-#   list_id:                # 리스트 ID (본문=0, 테이블 셀=각각 고유 ID)
-#     - para_id:            # 문단 ID (해당 list_id 내 문단 순번)
-#       line_count:         # 줄 수
-#       start_char_id:      # 시작 char_id
-#       next_line_char_id:  # 다음 줄 시작 char_id (1줄이면 null)
-#       end_char_id:        # 마지막 char_id
-#       style_name:         # 문단 스타일 이름
-#       align:              # 정렬 (왼쪽/가운데/오른쪽/양쪽/배분)
-#       indent:             # 첫줄 들여쓰기 (HWPUNIT)
-#       margin_left:        # 왼쪽 여백
-#       margin_right:       # 오른쪽 여백
-#       line_spacing:       # 줄 간격
-#       line_spacing_type:  # 줄 간격 타입 (퍼센트/고정값/여백만/최소)
-#       space_before:       # 문단 앞 간격
-#       space_after:        # 문단 뒤 간격
-#       char_style:         # 글자 스타일
-#         font_name:        # 글꼴
-#         font_size:        # 크기 (pt)
-#         bold:             # 굵게
-#         italic:           # 기울임
-#         underline:        # 밑줄
-#         strikeout:        # 취소선
-#         text_color:       # 글자색 (RGB hex)
-#         highlight_color:  # 형광펜 색상
+        header = _YAML_HEADER
+        if stream is not None:
+            stream.write(header)
+            yaml.dump(grouped, stream, Dumper=_Dumper, allow_unicode=True,
+                      default_flow_style=False, sort_keys=False)
+            return None
 
-"""
-        yaml_content = yaml.dump(grouped, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        yaml_content = yaml.dump(grouped, Dumper=_Dumper, allow_unicode=True,
+                                 default_flow_style=False, sort_keys=False)
         return header + yaml_content
 
+    def write_yaml_queue(self, q: "queue.Queue", stream) -> None:
+        """
+        큐에서 ParaStyle을 받아 to_yaml과 같은 형식으로 stream에 기록 (None을 받으면 종료)
+
+        iter_para_styles 순서(list_id 오름차순)를 전제로 같은 list_id끼리 묶어 바로 기록
+        기록 중 예외가 나면 종료 신호까지 큐를 비운 뒤 다시 발생 (생산 쪽 q.put 멈춤 방지)
+        """
+        got_end = False
+
+        def _items():
+            nonlocal got_end
+            yield from iter(q.get, None)
+            got_end = True
+
+        try:
+            stream.write(_YAML_HEADER)
+            for list_id, group in groupby(_items(), key=lambda ps: ps.list_id):
+                items = []
+                for ps in group:
+                    item = ps.to_dict()
+                    del item['list_id']
+                    items.append(item)
+                yaml.dump({list_id: items}, stream, Dumper=_Dumper, allow_unicode=True,
+                          default_flow_style=False, sort_keys=False)
+        except BaseException:
+            # 종료 신호(None)를 이미 받았다면 더 비울 것이 없음 (다시 q.get 하면 영구 대기)
+            if not got_end:
+                while q.get() is not None:
+                    pass
+            raise
+
 
 try:
-    from hwp_file_manager import get_hwp_instance, open_file_dialog, get_active_filepath, create_hwp_instance
+    from hwp_file_manager import get_hwp_instance, open_file_dialog, get_active_filepath, create_hwp_instance, scan_text
 except ImportError:
-    from win32.hwp_file_manager import get_hwp_instance, open_file_dialog, get_active_filepath, create_hwp_instance
+    from win32.hwp_file_manager import get_hwp_instance, open_file_dialog, get_active_filepath, create_hwp_instance, scan_text
 
 
 def open_file_dialog_win32() -> Optional[str]:
@@ -702,44 +1022,73 @@ def main():
     print("문단 스타일 추출 중...")
     print()
 
-    # 문단 스타일 추출
-    para_styles = getter.get_all_para_styles()
-
-    print(f"총 {len(para_styles)}개 문단 추출됨")
-    print()
-    print("-" * 60)
-
-    # 결과 출력
-    for ps in para_styles:
-        print(f"[list_id={ps.list_id}, para_id={ps.para_id}]")
-        print(f"  스타일: {ps.style_name or '(없음)'}")
-        print(f"  줄 수: {ps.line_count}")
-        print(f"  정렬: {ps.align}")
-        print(f"  들여쓰기: {ps.indent}, 왼쪽여백: {ps.margin_left}, 오른쪽여백: {ps.margin_right}")
-        print(f"  줄간격: {ps.line_spacing} ({ps.line_spacing_type})")
-        print(f"  문단간격: 앞 {ps.space_before}, 뒤 {ps.space_after}")
-
-        if ps.char_style:
-            cs = ps.char_style
-            print(f"  글자: {cs.font_name}, {cs.font_size}pt", end="")
-            if cs.bold: print(", 굵게", end="")
-            if cs.italic: print(", 기울임", end="")
-            if cs.underline: print(", 밑줄", end="")
-            if cs.strikeout: print(", 취소선", end="")
-            if cs.text_color: print(f", 색상={cs.text_color}", end="")
-            print()
-
-        text_preview = ps.text[:50] + "..." if len(ps.text) > 50 else ps.text
-        print(f"  내용: {text_preview}")
-        print()
-
     # YAML 파일로 저장 (파일명_para.yaml)
     if filepath:
         output_path = os.path.splitext(filepath)[0] + "_para.yaml"
     else:
         output_path = r"C:\hwp_xml\win32\para_styles.yaml"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(getter.to_yaml(para_styles))
+
+    # 문단 스타일 추출 (COM 호출은 메인 스레드, YAML 직렬화/기록은 별도 스레드)
+    q = queue.Queue(maxsize=64)
+    writer_errors = []  # 기록 스레드 예외 (메인에서 확인)
+
+    def _writer():
+        try:
+            f = open(output_path, "w", encoding="utf-8")
+        except OSError as e:
+            writer_errors.append(e)
+            # 추출 쪽이 q.put에서 멈추지 않도록 종료 신호까지 비움
+            while q.get() is not None:
+                pass
+            return
+        try:
+            with f:
+                getter.write_yaml_queue(q, f)  # 기록 실패 시 큐 비우기는 내부에서 처리
+        except Exception as e:
+            writer_errors.append(e)
+
+    writer = threading.Thread(target=_writer)
+    writer.start()
+    print("-" * 60)
+
+    # 결과 출력 (목록을 모아두지 않고 추출하는 대로 출력)
+    count = 0
+    try:
+        for ps in getter.iter_para_styles(with_line_info=True):
+            q.put(ps)
+            count += 1
+
+            print(f"[list_id={ps.list_id}, para_id={ps.para_id}]")
+            print(f"  스타일: {ps.style_name or '(없음)'}")
+            print(f"  줄 수: {ps.line_count}")
+            print(f"  정렬: {ps.align}")
+            print(f"  들여쓰기: {ps.indent}, 왼쪽여백: {ps.margin_left}, 오른쪽여백: {ps.margin_right}")
+            print(f"  줄간격: {ps.line_spacing} ({ps.line_spacing_type})")
+            print(f"  문단간격: 앞 {ps.space_before}, 뒤 {ps.space_after}")
+
+            if ps.char_style:
+                cs = ps.char_style
+                print(f"  글자: {cs.font_name}, {cs.font_size}pt", end="")
+                if cs.bold: print(", 굵게", end="")
+                if cs.italic: print(", 기울임", end="")
+                if cs.underline: print(", 밑줄", end="")
+                if cs.strikeout: print(", 취소선", end="")
+                if cs.text_color: print(f", 색상={cs.text_color}", end="")
+                print()
+
+            text_preview = ps.text[:50] + "..." if len(ps.text) > 50 else ps.text
+            print(f"  내용: {text_preview}")
+            print()
+    finally:
+        q.put(None)
+        writer.join()
+
+    print("-" * 60)
+    print(f"총 {count}개 문단 추출됨")
+    if writer_errors:
+        # 파일이 없거나 일부만 기록되었을 수 있음
+        print(f"YAML 저장 실패: {writer_errors[0]}")
+        sys.exit(1)
     print(f"YAML 저장: {output_path}")
 
 
@@ -7,78 +7,93 @@ import sys
 import os
 from pathlib import Path
 
-# 프로젝트 루트 경로 설정
-_project_root = Path(__file__).parent.parent
-if str(_project_root) not in sys.path:
-    sys.path.insert(0, str(_project_root))
 
-# config에서 외부 의존성 경로 가져오기
-try:
-    from config import WIN32HWP_DIR
-    if str(WIN32HWP_DIR) not in sys.path:
-        sys.path.insert(0, str(WIN32HWP_DIR))
-except ImportError:
-    win32hwp_dir = os.environ.get('WIN32HWP_DIR', r'C:\win32hwp')
-    if win32hwp_dir not in sys.path:
-        sys.path.insert(0, win32hwp_dir)
-
-from cursor import get_hwp_instance
+def _ensure_paths():
+    """스크립트 실행 시에만 프로젝트 루트와 win32hwp 경로를 sys.path에 추가 (import 시에는 건드리지 않음)"""
+    # 프로젝트 루트 경로 설정
+    project_root = str(Path(__file__).parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    # config에서 외부 의존성 경로 가져오기
+    try:
+        from config import WIN32HWP_DIR
+        if str(WIN32HWP_DIR) not in sys.path:
+            sys.path.insert(0, str(WIN32HWP_DIR))
+    except ImportError:
+        win32hwp_dir = os.environ.get('WIN32HWP_DIR', r'C:\win32hwp')
+        if win32hwp_dir not in sys.path:
+            sys.path.insert(0, win32hwp_dir)
+
+
+def iter_table_anchors(hwp):
+    """
+    HeadCtrl 순서로 표 컨트롤을 하나씩 반환
+
+    Yields:
+        (앵커 위치 ParameterSet, 표 컨트롤) - 앵커는 표마다 한 번만 조회
+    """
+    ctrl = hwp.HeadCtrl
+    while ctrl:
+        try:
+            # 표가 아닌 컨트롤(그림, 머리말 등)은 CtrlID 한 번만 읽고 넘어감
+            if ctrl.CtrlID == "tbl":
+                yield ctrl.GetAnchorPos(0), ctrl
+        except Exception as e:
+            print(f"오류: {e}")
+        ctrl = ctrl.Next
 
 
 def get_all_table_info(hwp):
     """모든 테이블 정보 조회"""
     tables = []
-    ctrl = hwp.HeadCtrl
-    index = 0
+    # 루프 안에서 반복 조회하지 않도록 COM 메서드를 지역 변수로 바인딩
+    run = hwp.HAction.Run
+    set_pos_by_set = hwp.SetPosBySet
+    get_pos = hwp.GetPos
 
-    while ctrl:
+    for anchor, ctrl in iter_table_anchors(hwp):
         try:
-            if ctrl.CtrlID == "tbl":
-                # 앵커 위치
-                anchor = ctrl.GetAnchorPos(0)
-                list_id = anchor.Item("List")
-                para_id = anchor.Item("Para")
-                char_id = anchor.Item("Pos")
-
-                # 테이블로 이동하여 첫 셀 list_id 획득
-                hwp.SetPosBySet(anchor)
-                hwp.HAction.Run("SelectCtrlFront")
-                hwp.HAction.Run("ShapeObjTableSelCell")
-
-                pos = hwp.GetPos()
-                first_cell_list_id = pos[0]
-
-                # 행/열 수
-                row_cnt = 0
-                col_cnt = 0
-                try:
-                    props = ctrl.Properties
-                    row_cnt = props.Item("RowCnt") or 0
-                    col_cnt = props.Item("ColCnt") or 0
-                except:
-                    pass
-
-                tables.append({
-                    'index': index,
-                    'list_id': list_id,
-                    'para_id': para_id,
-                    'char_id': char_id,
-                    'first_cell_list_id': first_cell_list_id,
-                    'row_cnt': row_cnt,
-                    'col_cnt': col_cnt,
-                    'ctrl': ctrl,
-                })
-
-                # 선택 해제
-                hwp.HAction.Run("Cancel")
-                hwp.HAction.Run("MoveParentList")
-
-                index += 1
+            # 앵커 위치
+            list_id = anchor.Item("List")
+            para_id = anchor.Item("Para")
+            char_id = anchor.Item("Pos")
+
+            # 테이블로 이동하여 첫 셀 list_id 획득
+            set_pos_by_set(anchor)
+            run("SelectCtrlFront")
+            run("ShapeObjTableSelCell")
+
+            pos = get_pos()
+            first_cell_list_id = pos[0]
+
+            # 행/열 수
+            row_cnt = 0
+            col_cnt = 0
+            try:
+                props = ctrl.Properties
+                row_cnt = props.Item("RowCnt") or 0
+                col_cnt = props.Item("ColCnt") or 0
+            except:
+                pass
+
+            tables.append({
+                'index': len(tables),
+                'list_id': list_id,
+                'para_id': para_id,
+                'char_id': char_id,
+                'first_cell_list_id': first_cell_list_id,
+                'row_cnt': row_cnt,
+                'col_cnt': col_cnt,
+                'ctrl': ctrl,
+            })
+
+            # 선택 해제
+            run("Cancel")
+            run("MoveParentList")
         except Exception as e:
             print(f"오류: {e}")
 
-        ctrl = ctrl.Next
-
     return tables
 
 
@@ -87,6 +102,9 @@ def main():
     print("한글 파일 테이블 정보 조회")
     print("=" * 60)
 
+    _ensure_paths()
+    from cursor import get_hwp_instance
+
     hwp = get_hwp_instance()
     if not hwp:
         print("한글이 실행 중이 아닙니다.")
@@ -10,17 +10,24 @@ Windows 환경에서 한글 프로그램이 설치되어 있어야 합니다.
 - ctrl: 컨트롤 객체
 - char_id: 문자 ID
 - 기타 테이블 관련 속성들
+
+편의 함수 get_tables_from_file은 결과를 파일(경로 + 수정 시각)별로 캐시하므로
+반환되는 TableProperty의 ctrl은 항상 None (컨트롤이 필요하면 GetTableProperty 직접 사용)
 """
 
+import os
 import sys
-from dataclasses import dataclass, field
+import functools
+from contextlib import contextmanager
+from itertools import zip_longest
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Optional, Any, Union
 from enum import IntEnum
 
 try:
-    from hwp_file_manager import open_hwp
+    from hwp_file_manager import open_hwp, ensure_early_binding, scan_text
 except ImportError:
-    from win32.hwp_file_manager import open_hwp
+    from win32.hwp_file_manager import open_hwp, ensure_early_binding, scan_text
 
 
 # 한글 컨트롤 타입 상수
@@ -38,7 +45,41 @@ class CtrlType(IntEnum):
     FIELD = 0x25666c64  # '%fld' - 필드
 
 
-@dataclass
+# ctrl.Properties 항목 -> (TableProperty 속성, 변환 함수)
+_TABLE_PROP_ITEMS = (
+    ('RowCnt', 'row_count', None),
+    ('ColCnt', 'col_count', None),
+    ('TreatAsChar', 'treat_as_char', bool),
+    ('Protect', 'protect', bool),
+    ('RepeatHeader', 'repeat_header', bool),
+    ('CellSpacing', 'cell_spacing', None),
+    ('BorderFillIDRef', 'border_fill_id', None),
+)
+
+
+# CtrlID별로 컨트롤이 제공하는 속성 (hasattr 탐색은 CtrlID마다 한 번만)
+_CTRL_CAP_NAMES = ('GetAnchorPos', 'UserDesc', 'Properties', 'ShapeObject')
+_CTRL_CAPS = {"tbl": frozenset(_CTRL_CAP_NAMES)}
+
+
+def _ctrl_caps(ctrl, ctrl_id) -> frozenset:
+    """ctrl이 가진 _CTRL_CAP_NAMES 속성 집합 (CtrlID 기준으로 캐시)"""
+    caps = _CTRL_CAPS.get(ctrl_id)
+    if caps is None:
+        caps = _CTRL_CAPS[ctrl_id] = frozenset(
+            name for name in _CTRL_CAP_NAMES if hasattr(ctrl, name))
+    return caps
+
+
+def _ctrl_id_of(ctrl) -> Optional[str]:
+    """ctrl.CtrlID (없으면 None)"""
+    try:
+        return ctrl.CtrlID
+    except:
+        return None
+
+
+@dataclass(slots=True)
 class CellInfo:
     """테이블 셀 정보"""
     row: int
@@ -54,7 +95,7 @@ class CellInfo:
     char_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TableProperty:
     """테이블 속성 정보"""
     # 기본 식별 정보
@@ -130,16 +171,29 @@ class TableProperty:
         """셀 데이터를 2D 리스트로 반환"""
         if not self.cells:
             return []
-        return [[cell.text for cell in row] for row in self.cells]
+        # 반복되는 셀 텍스트는 한 문자열 객체로 공유
+        share = {}.setdefault
+        return [[share(cell.text, cell.text) for cell in row] for row in self.cells]
 
     def to_dataframe(self):
-        """pandas DataFrame으로 변환"""
+        """
+        pandas DataFrame으로 변환
+
+        셀 텍스트는 object 대신 string dtype 열로 저장 (pyarrow 있으면 string[pyarrow])
+        """
         try:
             import pandas as pd
             data = self.get_data_as_2d_list()
             if not data:
                 return pd.DataFrame()
-            return pd.DataFrame(data)
+            try:
+                import pyarrow  # noqa: F401
+                dtype = "string[pyarrow]"
+            except ImportError:
+                dtype = "string"
+            # 행 -> 열로 한 번에 바꿔 열 단위로 생성 (행 길이가 다르면 None으로 채움)
+            columns = zip_longest(*data)
+            return pd.DataFrame({i: pd.array(list(col), dtype=dtype) for i, col in enumerate(columns)})
         except ImportError:
             raise ImportError("pandas가 설치되어 있지 않습니다. pip install pandas")
 
@@ -177,6 +231,12 @@ class GetTableProperty:
         self.hwp = hwp
         self._visible = visible
         self._new_instance = new_instance
+        # (HAction, HTableCellAddr, HSet) - 셀마다 COM 속성 체인을 다시 조회하지 않도록 캐시
+        self._cell_addr = None
+        # 이 한글 버전의 표 Properties에 없는 항목 이름
+        self._missing_table_props = set()
+        # include_cells -> ((문서 경로, 파일 수정 시각), get_all_tables 결과 (ctrl=None 사본))
+        self._tables_cache = {}
 
         if self.hwp is None:
             self._init_hwp()
@@ -199,6 +259,8 @@ class GetTableProperty:
                 # 기존 인스턴스에 연결 시도
                 try:
                     self.hwp = win32.GetActiveObject("HWPFrame.HwpObject")
+                    # 새 인스턴스와 같이 early binding 래퍼 사용 (실패 시 그대로)
+                    self.hwp = ensure_early_binding(self.hwp)
                 except:
                     # 연결 실패 시 새로 생성
                     self.hwp = win32.gencache.EnsureDispatch("HWPFrame.HwpObject")
@@ -224,18 +286,99 @@ class GetTableProperty:
         Returns:
             성공 여부
         """
+        self.invalidate_cache()
         return open_hwp(self.hwp, file_path, "HWP")
 
+    def invalidate_cache(self):
+        """get_all_tables 결과 캐시 비우기"""
+        self._tables_cache.clear()
+
+    def _doc_key(self) -> Optional[tuple]:
+        """
+        캐시 키로 쓸 현재 문서의 (경로, 파일 수정 시각)
+
+        저장되지 않았거나 저장 후 수정된 문서면 None (캐시 사용 안 함)
+        """
+        try:
+            doc = self.hwp.XHwpDocuments.Active_XHwpDocument
+            path = doc.FullName  # 문서 전체 경로 (Path는 폴더일 수 있음)
+            if not path or doc.Modified:
+                return None
+            return (path, os.path.getmtime(path))
+        except:
+            return None
+
+    def _cached_tables(self, include_cells: bool) -> Optional[List[TableProperty]]:
+        """
+        현재 문서에 대해 캐시된 get_all_tables 결과 (ctrl은 None, 그대로 반환하지 말고 _from_cache 사용)
+
+        셀 없이 요청하면 셀 포함 결과도 사용
+        """
+        doc_key = self._doc_key()
+        if doc_key is None:
+            return None
+        for key in ((True,) if include_cells else (False, True)):
+            cached = self._tables_cache.get(key)
+            if cached and cached[0] == doc_key:
+                return cached[1]
+        return None
+
+    def _table_ctrls(self, limit: Optional[int] = None) -> list:
+        """HeadCtrl 순회로 현재 문서의 표 컨트롤 목록 (limit개를 찾으면 중단)"""
+        ctrls = []
+        ctrl = self.hwp.HeadCtrl
+        while ctrl and (limit is None or len(ctrls) < limit):
+            if ctrl.CtrlID == "tbl":
+                ctrls.append(ctrl)
+            ctrl = ctrl.Next
+        return ctrls
+
+    @staticmethod
+    def _from_cache(table: TableProperty, ctrl, include_cells: bool) -> TableProperty:
+        """캐시된 표의 사본 (현재 문서의 ctrl을 붙이고, 셀은 요청한 경우에만 복사)"""
+        cells = [[replace(cell) for cell in row] for row in table.cells] if include_cells else []
+        return replace(table, ctrl=ctrl, cells=cells)
+
+    @contextmanager
+    def _cell_scan_mode(self):
+        """
+        셀 순회 동안 한글 창을 숨겨 셀 이동마다 화면을 다시 그리지 않도록 함
+
+        종료 시 창 표시 상태, 메시지박스 모드, 커서 위치를 원래대로 복원
+        """
+        window = None
+        visible = None
+        start = None
+        try:
+            start = self.hwp.GetPos()
+            window = self.hwp.XHwpWindows.Item(0)
+            visible = window.Visible
+            window.Visible = False
+        except:
+            pass
+        prev_mode = self.hwp.SetMessageBoxMode(0x7FFFFFFF)
+        try:
+            yield
+        finally:
+            self.hwp.SetMessageBoxMode(prev_mode)
+            try:
+                if start:
+                    self.hwp.SetPos(start[0], start[1], start[2])
+                if window is not None and visible is not None:
+                    window.Visible = visible
+            except:
+                pass
+
     def _get_ctrl_properties(self, ctrl) -> Dict[str, Any]:
         """컨트롤의 속성 추출"""
         props = {}
 
         try:
             # 기본 속성
-            props['ctrl_id'] = ctrl.CtrlID if hasattr(ctrl, 'CtrlID') else None
+            props['ctrl_id'] = ctrl_id = _ctrl_id_of(ctrl)
 
             # Properties 객체에서 속성 추출
-            if hasattr(ctrl, 'Properties'):
+            if 'Properties' in _ctrl_caps(ctrl, ctrl_id):
                 ctrl_props = ctrl.Properties
 
                 # 표 속성 항목들
@@ -261,9 +404,15 @@ class GetTableProperty:
 
         return props
 
-    def _get_table_cells(self, ctrl) -> List[List[CellInfo]]:
-        """테이블의 모든 셀 정보 추출"""
+    def _get_table_cells(self, ctrl, seen: Optional[Dict[str, str]] = None) -> List[List[CellInfo]]:
+        """
+        테이블의 모든 셀 정보 추출
+
+        Args:
+            seen: 같은 셀 텍스트("O", "X", 빈 문자열 등)를 한 객체로 공유할 dict (여러 표에 걸쳐 재사용 가능)
+        """
         cells = []
+        share = (seen if seen is not None else {}).setdefault
 
         try:
             # 현재 위치 저장
@@ -292,6 +441,7 @@ class GetTableProperty:
 
                     # 셀 텍스트 추출
                     cell_text = self._get_cell_text()
+                    cell_text = share(cell_text, cell_text)
 
                     cell_info = CellInfo(
                         row=row,
@@ -312,16 +462,35 @@ class GetTableProperty:
         """지정된 셀로 이동"""
         try:
             # TableCellAddr 액션 사용
-            param_set = self.hwp.HParameterSet.HTableCellAddr
-            self.hwp.HAction.GetDefault("TableCellAddr", param_set.HSet)
+            if self._cell_addr is None:
+                param_set = self.hwp.HParameterSet.HTableCellAddr
+                self._cell_addr = (self.hwp.HAction, param_set, param_set.HSet)
+            action, param_set, hset = self._cell_addr
+            action.GetDefault("TableCellAddr", hset)
             param_set.Row = row
             param_set.Col = col
-            self.hwp.HAction.Execute("TableCellAddr", param_set.HSet)
+            action.Execute("TableCellAddr", hset)
         except:
             pass
 
     def _get_cell_text(self) -> str:
-        """현재 셀의 텍스트 추출"""
+        """
+        현재 셀의 텍스트 추출
+
+        InitScan/GetText로 현재 셀(list) 범위만 읽어 SelectAll/Cancel 선택 동작과 화면 갱신을 생략
+        (스캔을 쓸 수 없으면 선택 방식으로 대체)
+        """
+        try:
+            # 0x07: 컨트롤 제외 텍스트만 (하위 list 제외), 0x0055: 시작/끝 = 현재 list
+            # 문단 사이는 GetTextFile과 같이 줄바꿈으로 구분됨
+            text = scan_text(self.hwp, 0x07, 0x0055)
+        except Exception:
+            return self._get_cell_text_block()
+
+        return text.strip()
+
+    def _get_cell_text_block(self) -> str:
+        """현재 셀의 텍스트 추출 (셀 전체 선택 후 GetTextFile)"""
         try:
             # 셀 전체 선택
             self.hwp.HAction.Run("SelectAll")
@@ -342,63 +511,45 @@ class GetTableProperty:
         table_prop.ctrl = ctrl
 
         try:
+            ctrl_id = _ctrl_id_of(ctrl)
+            caps = _ctrl_caps(ctrl, ctrl_id)
+
             # 기본 ID 정보
-            if hasattr(ctrl, 'GetAnchorPos'):
+            if 'GetAnchorPos' in caps:
                 pos = ctrl.GetAnchorPos(0)
                 # pos는 (List, Para, Pos) 튜플 형태
                 if pos:
                     table_prop.para_id = pos[1] if len(pos) > 1 else None
                     table_prop.char_id = pos[2] if len(pos) > 2 else None
 
-            # UserDesc에서 추가 정보 추출
-            if hasattr(ctrl, 'UserDesc'):
+            # CtrlID 추출 (없으면 UserDesc 사용)
+            if ctrl_id is not None:
+                table_prop.ctrl_id = ctrl_id
+            elif 'UserDesc' in caps:
                 table_prop.ctrl_id = ctrl.UserDesc
 
-            # CtrlID 추출
-            if hasattr(ctrl, 'CtrlID'):
-                table_prop.ctrl_id = ctrl.CtrlID
-
             # Properties에서 상세 속성 추출
-            if hasattr(ctrl, 'Properties'):
+            if 'Properties' in caps:
                 props = ctrl.Properties
 
-                try:
-                    table_prop.row_count = props.Item('RowCnt')
-                except:
-                    pass
-
-                try:
-                    table_prop.col_count = props.Item('ColCnt')
-                except:
-                    pass
-
-                try:
-                    table_prop.treat_as_char = bool(props.Item('TreatAsChar'))
-                except:
-                    pass
-
-                try:
-                    table_prop.protect = bool(props.Item('Protect'))
-                except:
-                    pass
-
-                try:
-                    table_prop.repeat_header = bool(props.Item('RepeatHeader'))
-                except:
-                    pass
-
-                try:
-                    table_prop.cell_spacing = props.Item('CellSpacing')
-                except:
-                    pass
-
-                try:
-                    table_prop.border_fill_id = props.Item('BorderFillIDRef')
-                except:
-                    pass
+                item = props.Item
+                missing = self._missing_table_props
+                for item_name, attr, conv in _TABLE_PROP_ITEMS:
+                    # 한 번 조회에 실패한 항목은 다음 표부터 건너뜀 (표마다 예외 발생/처리 반복 방지)
+                    if item_name in missing:
+                        continue
+                    try:
+                        value = item(item_name)
+                    except:
+                        missing.add(item_name)
+                        continue
+                    try:
+                        setattr(table_prop, attr, conv(value) if conv else value)
+                    except:
+                        pass
 
             # 크기 정보 (ShapeObject)
-            if hasattr(ctrl, 'ShapeObject'):
+            if 'ShapeObject' in caps:
                 shape = ctrl.ShapeObject
                 if shape:
                     try:
@@ -436,13 +587,38 @@ class GetTableProperty:
         Returns:
             TableProperty 리스트
         """
+        cached = self._cached_tables(include_cells)
+        if cached is not None:
+            # 컨트롤 참조는 캐시하지 않으므로 현재 문서에서 다시 찾음 (개수가 다르면 새로 순회)
+            try:
+                ctrls = self._table_ctrls()
+            except Exception:
+                ctrls = None
+            if ctrls is not None and len(ctrls) == len(cached):
+                return [self._from_cache(table, ctrl, include_cells)
+                        for table, ctrl in zip(cached, ctrls)]
+
+        if include_cells:
+            # 셀 순회는 표마다 커서를 옮기므로 화면 갱신 없이 진행
+            with self._cell_scan_mode():
+                tables = self._collect_tables(include_cells)
+        else:
+            tables = self._collect_tables(include_cells)
+
+        # 같은 문서에 대한 다음 호출은 COM 순회 없이 반환 (저장된 내용 그대로인 문서일 때만)
+        doc_key = self._doc_key()
+        if doc_key is not None:
+            self._tables_cache[include_cells] = (
+                doc_key, [self._from_cache(table, None, include_cells) for table in tables])
+        return tables
+
+    def _collect_tables(self, include_cells: bool) -> List[TableProperty]:
+        """get_all_tables 본문 (HeadCtrl 순회는 커서 위치와 무관하므로 문서 처음으로 이동하지 않음)"""
         tables = []
         table_index = 0
+        seen = {}  # 셀 텍스트 공유 (모든 표 공통)
 
         try:
-            # 문서 처음으로 이동
-            self.hwp.HAction.Run("MoveDocBegin")
-
             # 컨트롤 순회
             ctrl = self.hwp.HeadCtrl
 
@@ -452,7 +628,7 @@ class GetTableProperty:
                     table_prop = self._extract_table_property(ctrl, table_index)
 
                     if include_cells:
-                        table_prop.cells = self._get_table_cells(ctrl)
+                        table_prop.cells = self._get_table_cells(ctrl, seen)
 
                     tables.append(table_prop)
                     table_index += 1
@@ -476,10 +652,41 @@ class GetTableProperty:
         Returns:
             TableProperty 또는 None
         """
-        tables = self.get_all_tables(include_cells=include_cells)
+        if index < 0:
+            return None
+
+        cached = self._cached_tables(include_cells)
+        if cached is not None:
+            if index >= len(cached):
+                return None
+            try:
+                ctrls = self._table_ctrls(index + 1)
+            except Exception:
+                ctrls = []
+            if len(ctrls) == index + 1:
+                return self._from_cache(cached[index], ctrls[index], include_cells)
+
+        try:
+            # 컨트롤 순회 (해당 인덱스의 표에서 멈추고 그 표만 추출)
+            table_index = 0
+            ctrl = self.hwp.HeadCtrl
+
+            while ctrl:
+                if ctrl.CtrlID == "tbl":
+                    if table_index == index:
+                        table_prop = self._extract_table_property(ctrl, table_index)
+
+                        if include_cells:
+                            with self._cell_scan_mode():
+                                table_prop.cells = self._get_table_cells(ctrl)
 
-        if 0 <= index < len(tables):
-            return tables[index]
+                        return table_prop
+                    table_index += 1
+
+                ctrl = ctrl.Next
+
+        except Exception as e:
+            print(f"테이블 {index} 조회 오류: {e}")
 
         return None
 
@@ -524,17 +731,16 @@ class GetTableProperty:
             # 문서 처음으로
             self.hwp.HAction.Run("MoveDocBegin")
 
-            # n번째 표까지 이동
-            for i in range(index + 1):
-                # FindCtrl로 다음 표 찾기
-                self.hwp.HAction.GetDefault("Goto", self.hwp.HParameterSet.HGotoE.HSet)
-                self.hwp.HParameterSet.HGotoE.SetItem("DialogResult", 31)  # 표
-                self.hwp.HParameterSet.HGotoE.SetItem("SetItemCount", i + 1)
+            # n번째 표로 바로 이동 (SetItemCount가 문서 처음부터의 표 번호이므로 앞의 표를 거칠 필요 없음)
+            action = self.hwp.HAction
+            goto = self.hwp.HParameterSet.HGotoE
+            goto_set = goto.HSet
 
-                if not self.hwp.HAction.Execute("Goto", self.hwp.HParameterSet.HGotoE.HSet):
-                    return False
+            action.GetDefault("Goto", goto_set)
+            goto.SetItem("DialogResult", 31)  # 표
+            goto.SetItem("SetItemCount", index + 1)
 
-            return True
+            return bool(action.Execute("Goto", goto_set))
 
         except:
             return False
@@ -583,10 +789,11 @@ class GetTableProperty:
         try:
             ctrl = self.hwp.ParentCtrl
             if ctrl:
+                ctrl_id = ctrl.CtrlID
                 return {
-                    'ctrl_id': ctrl.CtrlID,
+                    'ctrl_id': ctrl_id,
                     'ctrl': ctrl,
-                    'user_desc': ctrl.UserDesc if hasattr(ctrl, 'UserDesc') else None,
+                    'user_desc': ctrl.UserDesc if 'UserDesc' in _ctrl_caps(ctrl, ctrl_id) else None,
                 }
         except:
             pass
@@ -595,10 +802,35 @@ class GetTableProperty:
 
 
 # 편의 함수
+# 같은 파일(경로 + 수정 시각)을 다시 요청하면 한글을 열고 순회하지 않고 이전 결과 사용
+# 캐시에는 순수 데이터만 보관 (COM 컨트롤/한글 객체를 붙잡아 두지 않도록 ctrl 참조 제거)
+@functools.lru_cache(maxsize=8)
+def _get_tables_cached(file_path: str, include_cells: bool, mtime: float) -> tuple:
+    getter = GetTableProperty(visible=False)
+    getter.open(file_path)
+    return tuple(replace(table, ctrl=None)
+                 for table in getter.get_all_tables(include_cells=include_cells))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_table_data_cached(file_path: str, table_index: int, mtime: float) -> tuple:
+    getter = GetTableProperty(visible=False)
+    getter.open(file_path)
+    table = getter.get_table_by_index(table_index, include_cells=True)
+
+    if table:
+        return tuple(tuple(row) for row in table.get_data_as_2d_list())
+
+    return ()
+
+
 def get_tables_from_file(file_path: str, include_cells: bool = False) -> List[TableProperty]:
     """
     한글 파일에서 모든 테이블 속성 추출 (편의 함수)
 
+    파일 수정 시각이 같으면 캐시된 결과의 사본 반환 (get_tables_from_file.cache_clear()로 비움)
+    반환되는 TableProperty의 ctrl은 None (컨트롤이 필요하면 GetTableProperty 직접 사용)
+
     Args:
         file_path: 한글 파일 경로
         include_cells: 셀 내용 포함 여부
@@ -606,15 +838,18 @@ def get_tables_from_file(file_path: str, include_cells: bool = False) -> List[Ta
     Returns:
         TableProperty 리스트
     """
-    getter = GetTableProperty(visible=False)
-    getter.open(file_path)
-    return getter.get_all_tables(include_cells=include_cells)
+    mtime = os.path.getmtime(file_path)
+    # 캐시된 객체를 호출자가 수정해도 다음 결과에 남지 않도록 표/셀 사본 반환
+    return [GetTableProperty._from_cache(table, None, include_cells)
+            for table in _get_tables_cached(file_path, include_cells, mtime)]
 
 
 def get_table_data_as_list(file_path: str, table_index: int = 0) -> List[List[str]]:
     """
     한글 파일에서 특정 테이블의 데이터를 2D 리스트로 추출 (편의 함수)
 
+    파일 수정 시각이 같으면 캐시된 결과 반환 (get_table_data_as_list.cache_clear()로 비움)
+
     Args:
         file_path: 한글 파일 경로
         table_index: 테이블 인덱스
@@ -622,65 +857,68 @@ def get_table_data_as_list(file_path: str, table_index: int = 0) -> List[List[st
     Returns:
         2D 문자열 리스트
     """
-    getter = GetTableProperty(visible=False)
-    getter.open(file_path)
-    table = getter.get_table_by_index(table_index, include_cells=True)
+    mtime = os.path.getmtime(file_path)
+    return [list(row) for row in _get_table_data_cached(file_path, table_index, mtime)]
 
-    if table:
-        return table.get_data_as_2d_list()
 
-    return []
+get_tables_from_file.cache_clear = _get_tables_cached.cache_clear
+get_table_data_as_list.cache_clear = _get_table_data_cached.cache_clear
 
 
 # 사용 예제
+_USAGE = """\
+============================================================
+한글 COM API 테이블 속성 추출 클래스
+============================================================
+
+사용 예제:
+
+```python
+from get_table_property import GetTableProperty
+
+# 1. 한글 프로그램에 연결
+getter = GetTableProperty()
+
+# 2. 파일 열기
+getter.open("document.hwp")
+
+# 3. 모든 테이블 속성 가져오기
+tables = getter.get_all_tables()
+for table in tables:
+    print(f'테이블 {table.table_index}:')
+    print(f'  - para_id: {table.para_id}')
+    print(f'  - char_id: {table.char_id}')
+    print(f'  - ctrl_id: {table.ctrl_id}')
+    print(f'  - 행 수: {table.row_count}')
+    print(f'  - 열 수: {table.col_count}')
+
+# 4. 특정 테이블 속성 (셀 포함)
+table = getter.get_table_by_index(0, include_cells=True)
+print(table.get_data_as_2d_list())
+
+# 5. DataFrame으로 변환
+df = table.to_dataframe()
+
+# 6. 현재 커서 위치의 테이블
+current_table = getter.get_current_table()
+
+# 7. 위치 정보 조회
+pos_info = getter.get_position_info()
+print(f'para_id: {pos_info["para_id"]}, char_id: {pos_info["char_id"]}')
+```
+
+주요 속성:
+  - link_id: 연결 ID
+  - para_id: 문단 ID
+  - char_id: 문자 ID
+  - ctrl_id: 컨트롤 ID
+  - ctrl: 컨트롤 객체 (COM 객체)
+  - row_count / col_count: 행/열 수
+  - width / height: 크기
+  - treat_as_char: 글자처럼 취급
+  - repeat_header: 제목 줄 반복
+"""
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("한글 COM API 테이블 속성 추출 클래스")
-    print("=" * 60)
-    print()
-    print("사용 예제:")
-    print()
-    print("```python")
-    print("from get_table_property import GetTableProperty")
-    print()
-    print("# 1. 한글 프로그램에 연결")
-    print("getter = GetTableProperty()")
-    print()
-    print("# 2. 파일 열기")
-    print('getter.open("document.hwp")')
-    print()
-    print("# 3. 모든 테이블 속성 가져오기")
-    print("tables = getter.get_all_tables()")
-    print("for table in tables:")
-    print("    print(f'테이블 {table.table_index}:')")
-    print("    print(f'  - para_id: {table.para_id}')")
-    print("    print(f'  - char_id: {table.char_id}')")
-    print("    print(f'  - ctrl_id: {table.ctrl_id}')")
-    print("    print(f'  - 행 수: {table.row_count}')")
-    print("    print(f'  - 열 수: {table.col_count}')")
-    print()
-    print("# 4. 특정 테이블 속성 (셀 포함)")
-    print("table = getter.get_table_by_index(0, include_cells=True)")
-    print("print(table.get_data_as_2d_list())")
-    print()
-    print("# 5. DataFrame으로 변환")
-    print("df = table.to_dataframe()")
-    print()
-    print("# 6. 현재 커서 위치의 테이블")
-    print("current_table = getter.get_current_table()")
-    print()
-    print("# 7. 위치 정보 조회")
-    print("pos_info = getter.get_position_info()")
-    print("print(f'para_id: {pos_info[\"para_id\"]}, char_id: {pos_info[\"char_id\"]}')")
-    print("```")
-    print()
-    print("주요 속성:")
-    print("  - link_id: 연결 ID")
-    print("  - para_id: 문단 ID")
-    print("  - char_id: 문자 ID")
-    print("  - ctrl_id: 컨트롤 ID")
-    print("  - ctrl: 컨트롤 객체 (COM 객체)")
-    print("  - row_count / col_count: 행/열 수")
-    print("  - width / height: 크기")
-    print("  - treat_as_char: 글자처럼 취급")
-    print("  - repeat_header: 제목 줄 반복")
+    sys.stdout.write(_USAGE)
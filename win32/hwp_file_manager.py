@@ -5,19 +5,59 @@
 HWP 인스턴스 연결, 파일 대화상자 등 공통 기능
 """
 
+import re
 from typing import Optional
 
 
-def get_hwp_instance():
+# HWPX section XML 경로 (번호 기준 정렬: section2 < section10)
+SECTION_RE = re.compile(r'^Contents/section(\d+)\.xml$')
+
+
+def section_files(names) -> list:
+    """ZIP 항목 이름 중 section XML만 번호 순으로 반환"""
+    sections = sorted(
+        (int(m.group(1)), name)
+        for name in names
+        if (m := SECTION_RE.match(name))
+    )
+    return [name for _, name in sections]
+
+
+# HWPX(ZIP) 재작성 시 이미 압축된 형식 (다시 deflate 해도 줄지 않으므로 무압축 저장)
+PRECOMPRESSED_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.zip', '.gz', '.mp3', '.mp4', '.avi', '.wmv',
+})
+
+
+def ensure_early_binding(hwp):
+    """
+    한글 COM 객체를 makepy(gencache) 래퍼로 변환 (early binding)
+
+    속성 접근마다 GetIDsOfNames를 거치지 않지만 속성 이름 대소문자를 정확히 써야 함
+    (예: HFileOpenSave.FileName). 변환할 수 없으면 원래 객체 반환
+    """
+    try:
+        import win32com.client as win32
+        return win32.gencache.EnsureDispatch(hwp)
+    except Exception:
+        return hwp
+
+
+def get_hwp_instance(early_bind: bool = False):
     """
     열린 한글 인스턴스 가져오기
 
+    Args:
+        early_bind: True면 ensure_early_binding 적용
+
     Returns:
         hwp: 한글 COM 객체 (없으면 None)
     """
     try:
         import win32com.client as win32
         hwp = win32.GetActiveObject("HWPFrame.HwpObject")
+        if early_bind:
+            hwp = ensure_early_binding(hwp)
         # 메시지박스 모드 먼저 설정 (모든 경고 자동 허용)
         # 0x00100000: 파일 손상/유출 위험 경고 자동 허용
         hwp.SetMessageBoxMode(0x7FFFFFFF)
@@ -29,18 +69,21 @@ def get_hwp_instance():
         return None
 
 
-def create_hwp_instance(visible: bool = True):
+def create_hwp_instance(visible: bool = True, early_bind: bool = False):
     """
     새 한글 인스턴스 생성
 
     Args:
         visible: 창 표시 여부
+        early_bind: True면 ensure_early_binding 적용
 
     Returns:
         hwp: 한글 COM 객체
     """
     import win32com.client as win32
     hwp = win32.Dispatch("HWPFrame.HwpObject")
+    if early_bind:
+        hwp = ensure_early_binding(hwp)
     # 메시지박스 모드 먼저 설정 (모든 경고 자동 허용)
     # 0x00100000: 파일 손상/유출 위험 경고 자동 허용
     hwp.SetMessageBoxMode(0x7FFFFFFF)
@@ -70,6 +113,25 @@ def get_or_create_hwp(visible: bool = True):
     return create_hwp_instance(visible), True
 
 
+def is_hwp_alive(hwp) -> bool:
+    """
+    한글 COM 객체가 아직 살아 있는지 확인 (한글이 종료되었으면 False)
+
+    Args:
+        hwp: 한글 COM 객체
+
+    Returns:
+        사용 가능 여부
+    """
+    if hwp is None:
+        return False
+    try:
+        hwp.XHwpDocuments.Count
+        return True
+    except:
+        return False
+
+
 def get_active_filepath(hwp) -> Optional[str]:
     """
     열린 문서의 파일 경로 가져오기
@@ -87,6 +149,41 @@ def get_active_filepath(hwp) -> Optional[str]:
         return None
 
 
+def scan_text(hwp, option: int, scan_range: int) -> str:
+    """
+    InitScan/GetText로 지정 범위의 텍스트 읽기 (선택 동작 없음)
+
+    GetText 상태: 0=텍스트 없음, 1=범위 끝, 2=일반 텍스트, 3=다음 문단으로 넘어감,
+    4/5=컨트롤 진입/탈출, 101 이상=실패
+    범위의 끝은 0/1로만 판단하고, 3은 문단 경계로 보고 줄바꿈(CRLF)을 넣은 뒤 계속 읽음
+    (범위가 현재 문단이면 3 없이 1로 끝남)
+
+    Args:
+        hwp: 한글 COM 객체
+        option: InitScan option (예: 0x07 = 컨트롤 제외 텍스트만)
+        scan_range: InitScan range (예: 0x0033 = 현재 문단, 0x0055 = 현재 list)
+
+    Returns:
+        읽은 텍스트 (GetText 실패 상태면 RuntimeError)
+    """
+    hwp.InitScan(option, scan_range)
+    try:
+        parts = []
+        while True:
+            state, text = hwp.GetText()
+            if state in (0, 1):
+                break
+            if state >= 100:
+                raise RuntimeError(f"GetText state={state}")
+            if state == 3:
+                parts.append("\r\n")
+            if state in (2, 3) and text:
+                parts.append(text)
+        return "".join(parts)
+    finally:
+        hwp.ReleaseScan()
+
+
 def open_file_dialog(
     title: str = "한글 파일 선택",
     filter_str: str = "한글 파일 (*.hwp;*.hwpx)\0*.hwp;*.hwpx\0모든 파일 (*.*)\0*.*\0\0"
@@ -130,7 +227,7 @@ def open_hwp(hwp, filepath: str, format: str = "HWP") -> bool:
     """
     try:
         hwp.HAction.GetDefault("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = filepath
+        hwp.HParameterSet.HFileOpenSave.FileName = filepath
         hwp.HParameterSet.HFileOpenSave.Format = format
         hwp.HAction.Execute("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
         return True
@@ -152,7 +249,7 @@ def save_hwp(hwp, filepath: str, format: str = "HWP") -> bool:
     """
     try:
         hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = filepath
+        hwp.HParameterSet.HFileOpenSave.FileName = filepath
         hwp.HParameterSet.HFileOpenSave.Format = format
         hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
         return True
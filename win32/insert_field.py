@@ -16,13 +16,33 @@
 import sys
 import os
 import time
-import tempfile
 import zipfile
-import shutil
 import yaml
-import xml.etree.ElementTree as ET
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
+# LibYAML(C) 덤퍼 우선 사용
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# lxml(libxml2) 사용 가능하면 우선 사용, 없으면 표준 ElementTree
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
+# HWPX 문단 네임스페이스 태그 (Clark 표기)
+_HP = '{http://www.hancom.co.kr/hwpml/2011/paragraph}'
+TAG_TBL = sys.intern(_HP + 'tbl')
+TAG_TR = sys.intern(_HP + 'tr')
+TAG_TC = sys.intern(_HP + 'tc')
+TAG_CELL_ADDR = sys.intern(_HP + 'cellAddr')
+
 _project_root = Path(__file__).parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
@@ -39,102 +59,144 @@ except ImportError:
 from hwpxml.get_cell_detail import GetCellDetail
 
 try:
-    from hwp_file_manager import create_hwp_instance
+    from hwp_file_manager import create_hwp_instance, PRECOMPRESSED_EXTS, section_files
 except ImportError:
-    from win32.hwp_file_manager import create_hwp_instance
+    from win32.hwp_file_manager import create_hwp_instance, PRECOMPRESSED_EXTS, section_files
 
 
+# 색상 판정용 고정 팔레트 (소문자, '#' 제외)
+_RED_COLORS = frozenset(('ff0000', 'cf2741', 'ff0000ff', 'cf2741ff'))
+_YELLOW_COLORS = frozenset(('ffff00', 'ffff00ff', 'fff000', 'fff000ff'))
+
+
+# 문서 내 색상 종류는 몇 개뿐이므로 원본 문자열 기준으로 결과 캐시
+@lru_cache(maxsize=512)
 def is_red_color(color: str) -> bool:
     """빨간색 계열인지 확인"""
-    if not color:
+    # 6자리 미만은 색상값이 될 수 없으므로 정규화 전에 바로 제외
+    if not color or len(color) < 6:
         return False
 
     color_lower = color.lower().strip().lstrip('#')
 
-    red_colors = ['ff0000', 'cf2741', 'ff0000ff', 'cf2741ff']
-    if color_lower in red_colors:
+    # R > 180 (0xB5 이상)이므로 첫 자리가 b~f가 아니면 hex 변환 없이 제외
+    if len(color_lower) < 6 or color_lower[0] not in 'bcdef':
+        return False
+
+    if color_lower in _RED_COLORS:
         return True
 
-    if len(color_lower) >= 6:
-        try:
-            r = int(color_lower[0:2], 16)
-            g = int(color_lower[2:4], 16)
-            b = int(color_lower[4:6], 16)
-            if r > 180 and g < 80 and b < 80:
-                return True
-        except:
-            pass
+    try:
+        v = int(color_lower[:6], 16)
+        r, g, b = v >> 16, (v >> 8) & 0xff, v & 0xff
+        if r > 180 and g < 80 and b < 80:
+            return True
+    except:
+        pass
     return False
 
 
+@lru_cache(maxsize=512)
 def is_yellow_color(color: str) -> bool:
     """노란색 계열인지 확인"""
-    if not color:
+    if not color or len(color) < 6:
         return False
 
     color_lower = color.lower().strip().lstrip('#')
 
-    yellow_colors = ['ffff00', 'ffff00ff', 'fff000', 'fff000ff']
-    if color_lower in yellow_colors:
+    # R > 200 (0xC9 이상)이므로 첫 자리가 c~f가 아니면 hex 변환 없이 제외
+    if len(color_lower) < 6 or color_lower[0] not in 'cdef':
+        return False
+
+    if color_lower in _YELLOW_COLORS:
         return True
 
-    if len(color_lower) >= 6:
-        try:
-            r = int(color_lower[0:2], 16)
-            g = int(color_lower[2:4], 16)
-            b = int(color_lower[4:6], 16)
-            # 노란색: R과 G가 높고, B가 낮음
-            if r > 200 and g > 200 and b < 100:
-                return True
-        except:
-            pass
+    try:
+        v = int(color_lower[:6], 16)
+        r, g, b = v >> 16, (v >> 8) & 0xff, v & 0xff
+        # 노란색: R과 G가 높고, B가 낮음
+        if r > 200 and g > 200 and b < 100:
+            return True
+    except:
+        pass
     return False
 
 
+def _rewrite_hwpx_sections(hwpx_path, transform) -> int:
+    """HWPX section XML을 압축 해제 없이 메모리에서 수정 후 다시 저장
+
+    Args:
+        hwpx_path: HWPX 파일 경로
+        transform: section 루트 요소를 받아 수정 여부(bool)를 반환하는 함수
+
+    Returns:
+        수정된 section 수 (0이면 파일을 건드리지 않음)
+    """
+    hwpx_path = str(hwpx_path)
+    rewritten = {}
+
+    with zipfile.ZipFile(hwpx_path, 'r') as zf_in:
+        # section은 번호 순서로 처리 (extract_cell_meta와 같은 테이블 순서)
+        for name in section_files(zf_in.namelist()):
+            tree = ET.parse(BytesIO(zf_in.read(name)))
+            if not transform(tree.getroot()):
+                continue
+            if _HAVE_LXML:
+                # libxml2 직렬화로 바로 bytes 생성 (원본 선언의 standalone="yes" 유지)
+                rewritten[name] = ET.tostring(
+                    tree, encoding='utf-8', xml_declaration=True,
+                    standalone=tree.docinfo.standalone or None)
+            else:
+                buf = BytesIO()
+                tree.write(buf, encoding='utf-8', xml_declaration=True)
+                rewritten[name] = buf.getvalue()
+
+        if not rewritten:
+            return 0
+
+        # 수정된 section만 교체, 그 외 항목은 원본 ZipInfo 그대로 복사
+        tmp_path = hwpx_path + '.tmp'
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zf_out:
+            for info in zf_in.infolist():
+                data = rewritten.get(info.filename)
+                if data is not None:
+                    # 중간 산출물이므로 압축률보다 속도 우선 (level 1)
+                    zf_out.writestr(info, data, zipfile.ZIP_DEFLATED, 1)
+                    continue
+
+                data = zf_in.read(info)
+
+                # 이미지 등 압축된 바이너리는 재압축하지 않음
+                if (info.compress_type != zipfile.ZIP_STORED
+                        and os.path.splitext(info.filename)[1].lower() in PRECOMPRESSED_EXTS):
+                    info.compress_type = zipfile.ZIP_STORED
+
+                zf_out.writestr(info, data)
+
+    os.replace(tmp_path, hwpx_path)
+    return len(rewritten)
+
+
 def clear_tc_names_in_hwpx(hwpx_path: str) -> int:
     """HWPX에서 모든 tc.name 속성 삭제
 
     Returns:
         삭제된 필드 수
     """
-    hwpx_path = Path(hwpx_path)
-    extract_dir = tempfile.mkdtemp()
     total_cleared = 0
 
-    try:
-        with zipfile.ZipFile(str(hwpx_path), 'r') as zf:
-            zf.extractall(extract_dir)
-
-        contents_dir = os.path.join(extract_dir, 'Contents')
-        section_files = sorted([
-            f for f in os.listdir(contents_dir)
-            if f.startswith('section') and f.endswith('.xml')
-        ])
-
-        for section_file in section_files:
-            section_path = os.path.join(contents_dir, section_file)
-            tree = ET.parse(section_path)
-            root = tree.getroot()
-
-            for tc in root.iter():
-                if tc.tag.endswith('}tc'):
-                    if 'name' in tc.attrib:
-                        del tc.attrib['name']
-                        total_cleared += 1
-
-            tree.write(section_path, encoding='utf-8', xml_declaration=True)
-
-        # 수정된 HWPX 다시 압축
-        with zipfile.ZipFile(str(hwpx_path), 'w', zipfile.ZIP_DEFLATED) as zf:
-            for root_dir, dirs, files in os.walk(extract_dir):
-                for file in files:
-                    file_path = os.path.join(root_dir, file)
-                    arcname = os.path.relpath(file_path, extract_dir)
-                    zf.write(file_path, arcname)
-
-    finally:
-        shutil.rmtree(extract_dir, ignore_errors=True)
-
+    def clear_names(root) -> bool:
+        nonlocal total_cleared
+        cleared = 0
+        # 태그 이름으로 tc만 순회 (lxml에서는 주석/PI 노드의 tag가 문자열이 아님)
+        for tc in root.iter(TAG_TC):
+            if 'name' in tc.attrib:
+                del tc.attrib['name']
+                cleared += 1
+        total_cleared += cleared
+        return cleared > 0
+
+    _rewrite_hwpx_sections(hwpx_path, clear_names)
     return total_cleared
 
 
@@ -154,7 +216,7 @@ def field_clear(file_path: str):
         hwp = create_hwp_instance(visible=False)
 
         hwp.HAction.GetDefault("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(file_path)
+        hwp.HParameterSet.HFileOpenSave.FileName = str(file_path)
         hwp.HParameterSet.HFileOpenSave.Format = "HWP"
         hwp.HAction.Execute("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
 
@@ -162,7 +224,7 @@ def field_clear(file_path: str):
         temp_hwpx = file_path.parent / f"{file_path.stem}_temp_clear.hwpx"
 
         hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(temp_hwpx)
+        hwp.HParameterSet.HFileOpenSave.FileName = str(temp_hwpx)
         hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
         hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
 
@@ -173,19 +235,24 @@ def field_clear(file_path: str):
         cleared = clear_tc_names_in_hwpx(str(temp_hwpx))
         print(f"삭제된 필드: {cleared}개")
 
-        # HWPX → HWP 덮어쓰기
-        hwp.HAction.GetDefault("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(temp_hwpx)
-        hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
-        hwp.HAction.Execute("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
+        if cleared:
+            # HWPX → HWP 덮어쓰기
+            hwp.HAction.GetDefault("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
+            hwp.HParameterSet.HFileOpenSave.FileName = str(temp_hwpx)
+            hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
+            hwp.HAction.Execute("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
 
-        hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(file_path)
-        hwp.HParameterSet.HFileOpenSave.Format = "HWP"
-        hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
+            hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
+            hwp.HParameterSet.HFileOpenSave.FileName = str(file_path)
+            hwp.HParameterSet.HFileOpenSave.Format = "HWP"
+            hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
 
         hwp.Quit()
-        print(f"HWP 저장: {file_path}")
+        if cleared:
+            print(f"HWP 저장: {file_path}")
+        else:
+            # 삭제할 필드가 없으면 원본 HWP 그대로 둠 (다시 열고 저장하는 과정 생략)
+            print(f"변경 없음: {file_path}")
 
         # 임시 HWPX 삭제
         temp_hwpx.unlink()
@@ -216,13 +283,13 @@ def convert_hwp_to_hwpx(hwp_path: str) -> str:
 
     # 파일 열기
     hwp.HAction.GetDefault("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
-    hwp.HParameterSet.HFileOpenSave.filename = str(hwp_path)
+    hwp.HParameterSet.HFileOpenSave.FileName = str(hwp_path)
     hwp.HParameterSet.HFileOpenSave.Format = "HWP"
     hwp.HAction.Execute("FileOpen", hwp.HParameterSet.HFileOpenSave.HSet)
 
     # HWPX로 저장
     hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-    hwp.HParameterSet.HFileOpenSave.filename = str(hwpx_path)
+    hwp.HParameterSet.HFileOpenSave.FileName = str(hwpx_path)
     hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
     hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
 
@@ -264,19 +331,18 @@ def process_hwpx_field(hwpx_path: str):
     print(f"입력: {hwpx_path}")
     print()
 
-    # 테이블 파싱
+    # 스타일 정의(header)만 먼저 로드, 셀 정보는 section 수정 중 같은 트리에서 추출
     parser = GetCellDetail()
-    all_tables = parser.from_hwpx_by_table(str(hwpx_path))
+    parser.load_header(str(hwpx_path))
 
-    if not all_tables:
-        print("테이블이 없습니다")
-        return
-
-    # 테이블별 셀 맵 생성 (병합 정보 포함)
+    # 테이블별 셀 맵 (병합 정보 포함) - section 순회 중 채움
     table_cells = {}
     table_info = {}  # 테이블 정보 (list_id, table_id)
-    for tbl_idx, cells in enumerate(all_tables):
-        table_cells[tbl_idx] = {}
+    table_owners = {}  # 테이블별 (행, 열) -> 해당 위치를 차지하는 셀의 시작 좌표
+
+    def add_table(tbl_idx, cells):
+        """테이블 셀 목록으로 셀 맵과 병합 인덱스 생성"""
+        cell_map = table_cells[tbl_idx] = {}
         # 첫 번째 셀에서 테이블 정보 가져오기
         if cells:
             table_info[tbl_idx] = {
@@ -284,208 +350,187 @@ def process_hwpx_field(hwpx_path: str):
                 'table_id': cells[0].table_id
             }
         for cell in cells:
-            text = ' '.join([p.text for p in cell.paragraphs]).strip()
-            bg_color = cell.border.bg_color if cell.border else ''
-            table_cells[tbl_idx][(cell.row, cell.col)] = {
-                'text': text,
+            border = cell.border
+            bg_color = border.bg_color if border else ''
+            # 색상 분류는 셀마다 한 번만 (탐색 중에는 플래그만 확인)
+            cell_map[(cell.row, cell.col)] = {
+                'text': ' '.join(p.text for p in cell.paragraphs).strip(),
                 'bg_color': bg_color,
+                'red': is_red_color(bg_color),
+                'yellow': is_yellow_color(bg_color),
                 'row_span': cell.row_span,
                 'col_span': cell.col_span,
                 'list_id': cell.list_id,
                 'table_id': cell.table_id
             }
 
-    def find_cell_at(cell_map, row, col):
+        # 병합 범위를 한 번만 펼쳐 둠 (먼저 나온 셀 우선, 시작 위치는 항상 자기 자신)
+        owner = {}
+        for (r, c), info in cell_map.items():
+            for rr in range(r, r + info['row_span']):
+                for cc in range(c, c + info['col_span']):
+                    owner.setdefault((rr, cc), (r, c))
+        owner.update((pos, pos) for pos in cell_map)
+        table_owners[tbl_idx] = owner
+
+    def find_cell_at(cell_map, cell_owner, row, col):
         """해당 위치의 셀 찾기 (병합된 셀 포함)
         Returns: (info, start_row, start_col) - 셀 정보와 시작 위치
         """
-        # 정확히 해당 위치에 셀이 있으면 반환
-        if (row, col) in cell_map:
-            return cell_map[(row, col)], row, col
+        start = cell_owner.get((row, col))
+        if start is None:
+            return {}, -1, -1
+        return cell_map[start], start[0], start[1]
 
-        # 병합된 셀 찾기: 이전 행/열에서 span이 이 위치를 포함하는 셀 찾기
-        for (r, c), info in cell_map.items():
-            row_span = info.get('row_span', 1)
-            col_span = info.get('col_span', 1)
-            if r <= row < r + row_span and c <= col < c + col_span:
-                return info, r, c
-        return {}, -1, -1
-
-    # HWPX 압축 해제
-    extract_dir = tempfile.mkdtemp()
     set_count = 0
     field_results = []  # 필드 설정 결과 저장
+    current_tbl_idx = 0
+
+    def set_fields(root) -> bool:
+        """section 하나의 색상 셀에 tc.name 설정, 수정 여부 반환"""
+        nonlocal set_count, current_tbl_idx
+        modified = False
+
+        # 테이블 찾기 (tbl 요소를 한 번만 파싱해 셀 맵 생성과 필드 설정에 함께 사용)
+        for tbl in root.iter(TAG_TBL):
+            add_table(current_tbl_idx, parser.parse_table(tbl))
+
+            cell_map = table_cells[current_tbl_idx]
+            cell_owner = table_owners[current_tbl_idx]
+
+            # 이 테이블의 셀들 처리
+            for tr in tbl.iterfind(TAG_TR):
+                for tc in tr.iterfind(TAG_TC):
+                    # 셀 주소 가져오기
+                    cell_addr = tc.find(TAG_CELL_ADDR)
+                    if cell_addr is None:
+                        continue
+                    addr = cell_addr.attrib
+                    try:
+                        row = int(addr['rowAddr'])
+                        col = int(addr['colAddr'])
+                    except KeyError:
+                        continue
 
-    try:
-        with zipfile.ZipFile(str(hwpx_path), 'r') as zf:
-            zf.extractall(extract_dir)
-
-        contents_dir = os.path.join(extract_dir, 'Contents')
-        section_files = sorted([
-            f for f in os.listdir(contents_dir)
-            if f.startswith('section') and f.endswith('.xml')
-        ])
-
-        current_tbl_idx = 0
+                    if row < 0 or col < 0:
+                        continue
 
-        for section_file in section_files:
-            section_path = os.path.join(contents_dir, section_file)
-            tree = ET.parse(section_path)
-            root = tree.getroot()
+                    # 셀 정보 가져오기
+                    cell_info, _, _ = find_cell_at(cell_map, cell_owner, row, col)
+                    if not cell_info:
+                        cell_info = {}
+                    cell_text = cell_info.get('text', '').strip()
+
+                    # 노란색 셀: 셀 텍스트를 필드명으로 사용 (20자 제한)
+                    if cell_info.get('yellow'):
+                        if cell_text:
+                            field_name = cell_text[:20]
+                            tc.set('name', field_name)
+                            set_count += 1
+                            modified = True
+                            print(f"  테이블{current_tbl_idx} ({row},{col}) -> [{field_name}]")
+                            # 결과 저장
+                            tbl_info = table_info.get(current_tbl_idx, {})
+                            field_results.append({
+                                'table_idx': current_tbl_idx,
+                                'list_id': tbl_info.get('list_id', ''),
+                                'table_id': tbl_info.get('table_id', ''),
+                                'row': row,
+                                'col': col,
+                                'field_name': field_name,
+                                'type': 'yellow'
+                            })
+                        continue
 
-            modified = False
+                    # 빨간색 배경이 아니면 스킵
+                    if not cell_info.get('red'):
+                        continue
 
-            # 테이블 찾기
-            for tbl in root.iter():
-                if tbl.tag.endswith('}tbl'):
-                    if current_tbl_idx not in table_cells:
-                        current_tbl_idx += 1
+                    # 텍스트가 있으면 스킵 (빈 셀에서만 필드 설정)
+                    if cell_text:
                         continue
 
-                    cell_map = table_cells[current_tbl_idx]
-
-                    # 이 테이블의 셀들 처리
-                    for tr in tbl:
-                        if not tr.tag.endswith('}tr'):
-                            continue
-                        for tc in tr:
-                            if not tc.tag.endswith('}tc'):
-                                continue
-
-                            # 셀 주소 가져오기
-                            row, col = -1, -1
-                            for child in tc:
-                                if child.tag.endswith('}cellAddr'):
-                                    row = int(child.get('rowAddr', -1))
-                                    col = int(child.get('colAddr', -1))
-                                    break
-
-                            if row < 0 or col < 0:
-                                continue
-
-                            # 셀 정보 가져오기
-                            cell_info, _, _ = find_cell_at(cell_map, row, col)
-                            if not cell_info:
-                                cell_info = {}
-                            bg_color = cell_info.get('bg_color', '')
-                            cell_text = cell_info.get('text', '').strip()
-
-                            # 노란색 셀: 셀 텍스트를 필드명으로 사용 (20자 제한)
-                            if is_yellow_color(bg_color):
-                                if cell_text:
-                                    field_name = cell_text[:20]
-                                    tc.set('name', field_name)
-                                    set_count += 1
-                                    modified = True
-                                    print(f"  테이블{current_tbl_idx} ({row},{col}) -> [{field_name}]")
-                                    # 결과 저장
-                                    tbl_info = table_info.get(current_tbl_idx, {})
-                                    field_results.append({
-                                        'table_idx': current_tbl_idx,
-                                        'list_id': tbl_info.get('list_id', ''),
-                                        'table_id': tbl_info.get('table_id', ''),
-                                        'row': row,
-                                        'col': col,
-                                        'field_name': field_name,
-                                        'type': 'yellow'
-                                    })
-                                continue
-
-                            # 빨간색 배경이 아니면 스킵
-                            if not is_red_color(bg_color):
-                                continue
-
-                            # 텍스트가 있으면 스킵 (빈 셀에서만 필드 설정)
-                            if cell_text:
-                                continue
-
-                            # 왼쪽으로 이동해서 최대 3개 텍스트 찾기 (빨간색 범위 내에서만)
-                            left_texts = []
-                            c = col - 1
-                            while c >= 0 and len(left_texts) < 3:
-                                info, start_r, start_c = find_cell_at(cell_map, row, c)
-                                # 빨간색 셀이 아니면 탐색 중단
-                                if not is_red_color(info.get('bg_color', '')):
-                                    break
-                                t = info.get('text', '').strip()
-                                if t:
-                                    left_texts.append(t)
-                                # 병합 셀의 시작 열로 점프 (다음 반복에서 그 왼쪽으로)
-                                c = start_c - 1 if start_c >= 0 else c - 1
-
-                            # 위쪽으로 이동해서 최대 3개 텍스트 찾기 (빨간색 범위 내에서만)
-                            top_texts = []
-                            r = row - 1
-                            while r >= 0 and len(top_texts) < 3:
-                                info, start_r, start_c = find_cell_at(cell_map, r, col)
-                                # 빨간색 셀이 아니면 탐색 중단
-                                if not is_red_color(info.get('bg_color', '')):
-                                    break
-                                t = info.get('text', '').strip()
-                                if t:
-                                    top_texts.append(t)
-                                # 병합 셀의 시작 행으로 점프 (다음 반복에서 그 위쪽으로)
-                                r = start_r - 1 if start_r >= 0 else r - 1
-
-                            # 필드명 생성: [L:좌1][L:좌2][T:위1][T:위2]
-                            parts = []
-                            # 왼쪽: L: 접두사
-                            for t in left_texts:
-                                parts.append('[L:' + t + ']')
-                            # 위쪽: T: 접두사
-                            for t in top_texts:
-                                parts.append('[T:' + t + ']')
-
-                            field_name = ''.join(parts)
-
-                            if field_name:
-                                tc.set('name', field_name)
-                                set_count += 1
-                                modified = True
-                                print(f"  테이블{current_tbl_idx} ({row},{col}) -> [{field_name}]")
-                                # 결과 저장
-                                tbl_info = table_info.get(current_tbl_idx, {})
-                                field_results.append({
-                                    'table_idx': current_tbl_idx,
-                                    'list_id': tbl_info.get('list_id', ''),
-                                    'table_id': tbl_info.get('table_id', ''),
-                                    'row': row,
-                                    'col': col,
-                                    'field_name': field_name,
-                                    'type': 'red'
-                                })
-
-                    current_tbl_idx += 1
-
-            # 수정된 XML 저장
-            if modified:
-                tree.write(section_path, encoding='utf-8', xml_declaration=True)
-
-        # 수정된 HWPX 다시 압축
-        with zipfile.ZipFile(str(hwpx_path), 'w', zipfile.ZIP_DEFLATED) as zf:
-            for root_dir, dirs, files in os.walk(extract_dir):
-                for file in files:
-                    file_path = os.path.join(root_dir, file)
-                    arcname = os.path.relpath(file_path, extract_dir)
-                    zf.write(file_path, arcname)
-
-        print()
-        print(f"설정된 필드: {set_count}개")
-        print(f"HWPX 저장 완료: {hwpx_path}")
-
-        # YAML 파일 출력 (data/원본파일명/ 폴더에 저장)
-        if field_results:
-            # data 폴더 생성 (원본 파일명 기준)
-            data_dir = hwpx_path.parent / 'data' / original_stem
-            data_dir.mkdir(parents=True, exist_ok=True)
-
-            yaml_path = data_dir / f"{original_stem}_field.yaml"
-            with open(yaml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(field_results, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-            print(f"YAML 저장: {yaml_path}")
-
-    finally:
-        shutil.rmtree(extract_dir, ignore_errors=True)
+                    # 왼쪽으로 이동해서 최대 3개 텍스트 찾기 (빨간색 범위 내에서만)
+                    left_texts = []
+                    c = col - 1
+                    while c >= 0 and len(left_texts) < 3:
+                        info, start_r, start_c = find_cell_at(cell_map, cell_owner, row, c)
+                        # 빨간색 셀이 아니면 탐색 중단
+                        if not info.get('red'):
+                            break
+                        t = info.get('text', '').strip()
+                        if t:
+                            left_texts.append(t)
+                        # 병합 셀의 시작 열로 점프 (다음 반복에서 그 왼쪽으로)
+                        c = start_c - 1 if start_c >= 0 else c - 1
+
+                    # 위쪽으로 이동해서 최대 3개 텍스트 찾기 (빨간색 범위 내에서만)
+                    top_texts = []
+                    r = row - 1
+                    while r >= 0 and len(top_texts) < 3:
+                        info, start_r, start_c = find_cell_at(cell_map, cell_owner, r, col)
+                        # 빨간색 셀이 아니면 탐색 중단
+                        if not info.get('red'):
+                            break
+                        t = info.get('text', '').strip()
+                        if t:
+                            top_texts.append(t)
+                        # 병합 셀의 시작 행으로 점프 (다음 반복에서 그 위쪽으로)
+                        r = start_r - 1 if start_r >= 0 else r - 1
+
+                    # 필드명 생성: [L:좌1][L:좌2][T:위1][T:위2]
+                    parts = []
+                    # 왼쪽: L: 접두사
+                    for t in left_texts:
+                        parts.append('[L:' + t + ']')
+                    # 위쪽: T: 접두사
+                    for t in top_texts:
+                        parts.append('[T:' + t + ']')
+
+                    field_name = ''.join(parts)
+
+                    if field_name:
+                        tc.set('name', field_name)
+                        set_count += 1
+                        modified = True
+                        print(f"  테이블{current_tbl_idx} ({row},{col}) -> [{field_name}]")
+                        # 결과 저장
+                        tbl_info = table_info.get(current_tbl_idx, {})
+                        field_results.append({
+                            'table_idx': current_tbl_idx,
+                            'list_id': tbl_info.get('list_id', ''),
+                            'table_id': tbl_info.get('table_id', ''),
+                            'row': row,
+                            'col': col,
+                            'field_name': field_name,
+                            'type': 'red'
+                        })
+
+            current_tbl_idx += 1
+
+        return modified
+
+    # 압축 해제 없이 section XML만 메모리에서 수정
+    _rewrite_hwpx_sections(hwpx_path, set_fields)
+
+    if not table_cells:
+        print("테이블이 없습니다")
+        return
+
+    print()
+    print(f"설정된 필드: {set_count}개")
+    print(f"HWPX 저장 완료: {hwpx_path}")
+
+    # YAML 파일 출력 (data/원본파일명/ 폴더에 저장)
+    if field_results:
+        # data 폴더 생성 (원본 파일명 기준)
+        data_dir = hwpx_path.parent / 'data' / original_stem
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        yaml_path = data_dir / f"{original_stem}_field.yaml"
+        with open(yaml_path, 'w', encoding='utf-8') as f:
+            yaml.dump(field_results, f, Dumper=_Dumper, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        print(f"YAML 저장: {yaml_path}")
 
 
 if __name__ == "__main__":
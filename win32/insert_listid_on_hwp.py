@@ -11,6 +11,13 @@ if not hwp:
     print("한글 인스턴스 없음")
     sys.exit(1)
 
+# 셀마다 COM 속성 체인을 다시 조회하지 않도록 바인딩
+action = hwp.HAction
+run = action.Run
+get_pos = hwp.GetPos
+insert_text = hwp.HParameterSet.HInsertText
+insert_set = insert_text.HSet
+
 ctrl = hwp.HeadCtrl
 tbl_count = 0
 
@@ -22,46 +29,46 @@ while ctrl:
         try:
             anchor = ctrl.GetAnchorPos(0)
             hwp.SetPosBySet(anchor)
-            hwp.HAction.Run("SelectCtrlFront")
-            hwp.HAction.Run("ShapeObjTableSelCell")
+            run("SelectCtrlFront")
+            run("ShapeObjTableSelCell")
 
-            first_list_id = hwp.GetPos()[0]
+            first_list_id = get_pos()[0]
             processed = set()
 
             row = 0
             while row < 100:
-                hwp.HAction.Run("TableColBegin")
-                row_first_list_id = hwp.GetPos()[0]
+                run("TableColBegin")
+                row_first_list_id = get_pos()[0]
                 col = 0
 
                 while col < 100:
-                    pos = hwp.GetPos()
+                    pos = get_pos()
                     list_id = pos[0]
 
                     if list_id not in processed:
                         processed.add(list_id)
                         # 셀에 list_id 텍스트 삽입
-                        hwp.HAction.Run("MoveLineEnd")
-                        hwp.HAction.GetDefault("InsertText", hwp.HParameterSet.HInsertText.HSet)
-                        hwp.HParameterSet.HInsertText.Text = f"\n[list_id:{list_id}]"
-                        hwp.HAction.Execute("InsertText", hwp.HParameterSet.HInsertText.HSet)
+                        run("MoveLineEnd")
+                        action.GetDefault("InsertText", insert_set)
+                        insert_text.Text = f"\n[list_id:{list_id}]"
+                        action.Execute("InsertText", insert_set)
 
-                    hwp.HAction.Run("TableRightCell")
-                    new_pos = hwp.GetPos()
+                    run("TableRightCell")
+                    new_pos = get_pos()
 
                     if new_pos[0] == row_first_list_id:
                         break
                     col += 1
 
-                hwp.HAction.Run("TableLowerCell")
-                new_pos = hwp.GetPos()
+                run("TableLowerCell")
+                new_pos = get_pos()
 
                 if new_pos[0] == first_list_id:
                     break
                 row += 1
 
-            hwp.HAction.Run("Cancel")
-            hwp.HAction.Run("MoveParentList")
+            run("Cancel")
+            run("MoveParentList")
             print(f"  {len(processed)}개 셀에 list_id 삽입 완료")
 
         except Exception as e:
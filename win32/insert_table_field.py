@@ -74,7 +74,7 @@ def get_or_create_hwp():
     return hwp
 
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """테이블 정보 (XML 기반)"""
     index: int = 0
@@ -121,7 +121,7 @@ class InsertTableField:
         """파일 저장"""
         try:
             self.hwp.HAction.GetDefault("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
-            self.hwp.HParameterSet.HFileOpenSave.filename = filepath
+            self.hwp.HParameterSet.HFileOpenSave.FileName = filepath
             self.hwp.HParameterSet.HFileOpenSave.Format = format.upper()
             self.hwp.HAction.Execute("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
             print(f"파일 저장: {filepath} ({format})")
@@ -281,29 +281,40 @@ class InsertTableField:
                                                parent_cell_row=parent_cell_row,
                                                parent_cell_col=parent_cell_col)
 
-    def collect_table_list_ids(self) -> List[dict]:
-        """win32 API로 테이블 list_id 수집 (첫 셀 list_id 기준)"""
+    def collect_table_list_ids(self, lazy_first_cell: bool = False) -> List[dict]:
+        """
+        win32 API로 테이블 list_id 수집 (첫 셀 list_id 기준)
+
+        Args:
+            lazy_first_cell: True면 표 안으로 이동하지 않고 CtrlID/앵커만 수집
+                (first_cell_list_id, caption_list_id는 None. insert_caption_text에는 불필요)
+        """
         table_infos = []
+        run = self.hwp.HAction.Run
         ctrl = self.hwp.HeadCtrl
         idx = 0
 
         while ctrl:
             if ctrl.CtrlID == "tbl":
                 try:
-                    # 테이블로 이동하여 첫 셀 list_id 획득
-                    anchor = ctrl.GetAnchorPos(0)
-                    self.hwp.SetPosBySet(anchor)
-                    self.hwp.HAction.Run("SelectCtrlFront")
-                    self.hwp.HAction.Run("ShapeObjTableSelCell")
+                    first_cell_list_id = None
+                    caption_list_id = None
+
+                    if not lazy_first_cell:
+                        # 테이블로 이동하여 첫 셀 list_id 획득
+                        anchor = ctrl.GetAnchorPos(0)
+                        self.hwp.SetPosBySet(anchor)
+                        run("SelectCtrlFront")
+                        run("ShapeObjTableSelCell")
 
-                    cell_pos = self.hwp.GetPos()
-                    first_cell_list_id = cell_pos[0]
+                        cell_pos = self.hwp.GetPos()
+                        first_cell_list_id = cell_pos[0]
 
-                    self.hwp.HAction.Run("Cancel")
-                    self.hwp.HAction.Run("MoveParentList")
+                        run("Cancel")
+                        run("MoveParentList")
 
-                    # 캡션 list_id = 첫 셀 list_id - 1
-                    caption_list_id = first_cell_list_id - 1
+                        # 캡션 list_id = 첫 셀 list_id - 1
+                        caption_list_id = first_cell_list_id - 1
 
                     table_infos.append({
                         'index': idx,
@@ -321,6 +332,11 @@ class InsertTableField:
     def insert_caption_text(self, table_infos: List[dict]) -> int:
         """테이블 캡션에 {caption:tbl_N|} 삽입 (캡션 직접 선택)"""
         count = 0
+        # 표마다 COM 속성 체인을 다시 조회하지 않도록 바인딩
+        action = self.hwp.HAction
+        run = action.Run
+        insert_text = self.hwp.HParameterSet.HInsertText
+        insert_set = insert_text.HSet
 
         for info in table_infos:
             try:
@@ -331,20 +347,20 @@ class InsertTableField:
                 self.hwp.SetPosBySet(anchor)
 
                 # 테이블 선택
-                self.hwp.HAction.Run("SelectCtrlFront")
+                run("SelectCtrlFront")
 
                 # 캡션 선택 (표/그림 캡션)
-                self.hwp.HAction.Run("TableCaptionCellCreate")
+                run("TableCaptionCellCreate")
 
                 # 캡션 텍스트 삽입
                 caption_text = f"{{caption:tbl_{info['index']}|}}"
 
-                self.hwp.HAction.GetDefault("InsertText", self.hwp.HParameterSet.HInsertText.HSet)
-                self.hwp.HParameterSet.HInsertText.Text = caption_text
-                self.hwp.HAction.Execute("InsertText", self.hwp.HParameterSet.HInsertText.HSet)
+                action.GetDefault("InsertText", insert_set)
+                insert_text.Text = caption_text
+                action.Execute("InsertText", insert_set)
 
                 # 선택 해제
-                self.hwp.HAction.Run("Cancel")
+                run("Cancel")
 
                 print(f"  캡션 삽입: tbl_{info['index']}")
                 count += 1
@@ -424,7 +440,7 @@ def process_hwp_file(input_hwp: str, output_hwp: str = None) -> bool:
 
     # 6. 테이블 list_id 수집 및 캡션 삽입
     print("\n캡션 삽입 중...")
-    table_infos = inserter.collect_table_list_ids()
+    table_infos = inserter.collect_table_list_ids(lazy_first_cell=True)
     caption_count = inserter.insert_caption_text(table_infos)
     print(f"{caption_count}개 테이블에 캡션 삽입 완료")
 
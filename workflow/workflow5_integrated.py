@@ -52,6 +52,7 @@ except ImportError:
         sys.path.insert(0, win32hwp_dir)
 
 from win32.hwp_file_manager import get_hwp_instance, create_hwp_instance, get_active_filepath, open_file_dialog, save_hwp, open_hwp
+from win32.insert_field import clear_tc_names_in_hwpx
 
 
 class Workflow5:
@@ -202,7 +203,7 @@ class Workflow5:
                 pass
 
         self.hwp.HAction.GetDefault("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
-        self.hwp.HParameterSet.HFileOpenSave.filename = self.temp_hwpx
+        self.hwp.HParameterSet.HFileOpenSave.FileName = self.temp_hwpx
         self.hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
         self.hwp.HAction.Execute("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
 
@@ -260,7 +261,7 @@ class Workflow5:
         open_hwp(self.hwp,self.temp_hwpx)
 
         print("캡션 삽입 중...")
-        table_infos = inserter.collect_table_list_ids()
+        table_infos = inserter.collect_table_list_ids(lazy_first_cell=True)
         caption_count = inserter.insert_caption_text(table_infos)
         print(f"  {caption_count}개 캡션 삽입")
 
@@ -270,12 +271,12 @@ class Workflow5:
         extractor = ExtractCellMeta(self.hwp)
 
         self.hwp.HAction.GetDefault("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
-        self.hwp.HParameterSet.HFileOpenSave.filename = self.temp_hwpx
+        self.hwp.HParameterSet.HFileOpenSave.FileName = self.temp_hwpx
         self.hwp.HParameterSet.HFileOpenSave.Format = "HWPX"
         self.hwp.HAction.Execute("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
 
-        self.cell_positions = extractor._extract_cell_positions()
         self.field_names = extractor._extract_field_names_from_hwpx(self.temp_hwpx)
+        self.cell_positions = extractor._extract_cell_positions(self.field_names)
         yaml_content = extractor._merge_to_yaml(self.cell_positions, self.field_names)
 
         with open(meta_yaml, 'w', encoding='utf-8') as f:
@@ -300,47 +301,8 @@ class Workflow5:
 
     def _clear_field_names_in_hwpx(self, hwpx_path: str):
         """HWPX에서 tc.name 속성만 삭제"""
-        import zipfile
-        import shutil
-        import xml.etree.ElementTree as ET
-
-        extract_dir = tempfile.mkdtemp()
-        total_cleared = 0
-
-        try:
-            with zipfile.ZipFile(hwpx_path, 'r') as zf:
-                zf.extractall(extract_dir)
-
-            contents_dir = os.path.join(extract_dir, 'Contents')
-            section_files = sorted([
-                f for f in os.listdir(contents_dir)
-                if f.startswith('section') and f.endswith('.xml')
-            ])
-
-            for section_file in section_files:
-                section_path = os.path.join(contents_dir, section_file)
-                tree = ET.parse(section_path)
-                root = tree.getroot()
-
-                for tc in root.iter():
-                    if tc.tag.endswith('}tc'):
-                        if 'name' in tc.attrib:
-                            del tc.attrib['name']
-                            total_cleared += 1
-
-                tree.write(section_path, encoding='utf-8', xml_declaration=True)
-
-            with zipfile.ZipFile(hwpx_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for root_dir, dirs, files in os.walk(extract_dir):
-                    for file in files:
-                        file_path = os.path.join(root_dir, file)
-                        arcname = os.path.relpath(file_path, extract_dir)
-                        zf.write(file_path, arcname)
-
-            print(f"필드명 삭제: {total_cleared}개 셀")
-
-        finally:
-            shutil.rmtree(extract_dir, ignore_errors=True)
+        total_cleared = clear_tc_names_in_hwpx(hwpx_path)
+        print(f"필드명 삭제: {total_cleared}개 셀")
 
     def _run_bookmark_excel(self, base_path: str, split_by_para: bool = True) -> str:
         """북마크별 시트 분리 Excel 생성"""